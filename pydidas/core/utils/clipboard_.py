@@ -46,6 +46,4 @@ def copy_text_to_system_clipbord(text: str):
     """
     if not isinstance(text, str):
         raise TypeError("Only strings can be copied to the system clipboard.")
-    _clip = QtWidgets.QApplication.clipboard()
-    _clip.clear()
-    _clip.setText(text)
+    QtWidgets.QApplication.clipboard().setText(text)
@@ -41,7 +41,6 @@ from typing import List, Tuple, Union
 
 from ..constants import FILENAME_DELIMITERS
 from ..exceptions import FileReadError, UserConfigError
-from .iterable_utils import flatten
 
 
 _FILE_NAME_SCHEME_ERROR_STR = (
@@ -126,18 +125,19 @@ def find_valid_python_files(path: Path) -> List[Path]:
             return [path]
         return []
     path = trim_filename(path)
-    _entries = [
-        path.joinpath(_item)
-        for _item in path.iterdir()
-        if not (_item.name.startswith("__") or _item.name.startswith("."))
-    ]
-    _dirs = [_item for _item in _entries if _item.is_dir()]
-    _files = [_item for _item in _entries if _item.is_file()]
-    _results = flatten(
-        [find_valid_python_files(path.joinpath(_entry)) for _entry in _dirs]
-    )
-    _results += [f for f in _files if f.suffix == ".py"]
-    return _results
+    _results = []
+    _files = []
+    # os.scandir provides the entry types from the directory listing itself and
+    # does not require an additional stat call per entry:
+    with os.scandir(path) as _entries:
+        for _entry in _entries:
+            if _entry.name.startswith("__") or _entry.name.startswith("."):
+                continue
+            if _entry.is_dir():
+                _results.extend(find_valid_python_files(path.joinpath(_entry.name)))
+            elif _entry.is_file() and _entry.name.endswith(".py"):
+                _files.append(path.joinpath(_entry.name))
+    return _results + _files
 
 
 def get_file_naming_scheme(
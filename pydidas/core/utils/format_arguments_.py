@@ -28,7 +28,6 @@ __status__ = "Production"
 __all__ = ["format_arguments"]
 
 
-import re
 from typing import List
 
 
@@ -51,20 +50,21 @@ def format_arguments(*args: tuple, **kwargs: dict) -> List[str]:
         An argparse-compatible list.
     """
     _new_args = []
-    for item, key in kwargs.items():
-        if key is True:
-            _new_args.append(f"--{item}")
+    _append = _new_args.append
+    for _key, _value in kwargs.items():
+        if _value is True:
+            _append(f"--{_key}")
         else:
-            _new_args.append(f"-{item}")
-            _new_args.append(key if isinstance(key, str) else str(key))
+            _append(f"-{_key}")
+            _append(str(_value))
 
     for arg in args:
-        arg = arg if isinstance(arg, str) else str(arg)
+        arg = str(arg)
         if "=" in arg or " " in arg:
-            _split_args = [item for item in re.split(" |=", arg) if item != ""]
+            _split_args = arg.replace("=", " ").split()
             if not _split_args[0].startswith("-"):
                 _split_args[0] = f"-{_split_args[0]}"
             _new_args += _split_args
         else:
-            _new_args.append(arg)
+            _append(arg)
     return _new_args
@@ -55,7 +55,7 @@ def get_hdf5_populated_dataset_keys(
     min_dim: int = 3,
     max_dim: Union[int, None] = None,
     file_ref: Union[h5py.File, None] = None,
-    ignore_keys: Union[list, None] = None,
+    ignore_keys: Union[list, tuple, None] = None,
 ) -> List[str]:
     """
     Get the dataset keys of all datasets that match the conditions.
@@ -84,7 +84,7 @@ def get_hdf5_populated_dataset_keys(
         A reference to the base hdf5 file. This information is used to
         detect external datasets. If not specified, this information will
         be queried from the base calling parameter <item>. The default is None.
-    ignore_keys : Union[list, None], optional
+    ignore_keys : Union[list, tuple, None], optional
         Dataset keys (or snippets of key names) to be ignored. Any keys
         starting with any of the items in this list are ignored.
         The default is None.
@@ -103,7 +103,7 @@ def get_hdf5_populated_dataset_keys(
         A list with all dataset keys which correspond to the filter criteria.
     """
     _close_on_exit = isinstance(item, (str, Path))
-    _ignore = ignore_keys if ignore_keys is not None else []
+    _ignore = tuple(ignore_keys) if ignore_keys is not None else ()
 
     if isinstance(item, h5py.Dataset):
         if hdf5_dataset_check(item, min_size, min_dim, max_dim, _ignore):
@@ -227,11 +227,17 @@ def fit_ellipse_from_points(xpoints: np.ndarray, ypoints: np.ndarray) -> np.ndar
         The coefficients for the formula
         F(x; y) = ax**2 + 2bxy + cy**2 + 2dx + 2fy + g = 0
     """
-    D1 = np.column_stack((xpoints**2, xpoints * ypoints, ypoints**2))
-    D2 = np.column_stack((xpoints, ypoints, np.ones(xpoints.size)))
-    S1 = np.matmul(D1.T, D1)
-    S2 = np.matmul(D1.T, D2)
-    S3 = np.matmul(D2.T, D2)
+    D = np.empty((xpoints.size, 6))
+    np.multiply(xpoints, xpoints, out=D[:, 0])
+    np.multiply(xpoints, ypoints, out=D[:, 1])
+    np.multiply(ypoints, ypoints, out=D[:, 2])
+    D[:, 3] = xpoints
+    D[:, 4] = ypoints
+    D[:, 5] = 1
+    S = np.matmul(D.T, D)
+    S1 = S[:3, :3]
+    S2 = S[:3, 3:]
+    S3 = S[3:, 3:]
     T = np.matmul(-np.linalg.inv(S3), S2.T)
     M = S1 + np.matmul(S2, T)
     inv_C1 = np.array(((0, 0, 0.5), (0, -1, 0), (0.5, 0, 0)))
@@ -34,6 +34,7 @@ __all__ = [
 ]
 
 
+import functools
 from collections.abc import Iterable
 
 from qtpy import QT_VERSION, QtGui
@@ -64,6 +65,24 @@ def _get_args_as_list(args: Iterable):
     return args
 
 
+@functools.cache
+def _get_setter_name(key: str) -> str:
+    """
+    Get the name of the Qt-style setter method for the given property key.
+
+    Parameters
+    ----------
+    key : str
+        The property key, e.g. "fixedWidth".
+
+    Returns
+    -------
+    str
+        The name of the setter method, e.g. "setFixedWidth".
+    """
+    return f"set{key[0].upper()}{key[1:]}"
+
+
 def update_child_qobject(obj: QObject, attr: str, **kwargs: dict):
     """
     Update the objects given atttribute in place.
@@ -129,11 +148,10 @@ def apply_qt_properties(obj: QObject, **kwargs: dict):
     **kwargs : dict
         A dictionary with properties to be set.
     """
-    for _key in kwargs:
-        _name = f"set{_key[0].upper()}{_key[1:]}"
-        if hasattr(obj, _name):
-            _func = getattr(obj, _name)
-            _func(*_get_args_as_list(kwargs.get(_key)))
+    for _key, _value in kwargs.items():
+        _func = getattr(obj, _get_setter_name(_key), None)
+        if _func is not None:
+            _func(*_get_args_as_list(_value))
 
 
 def update_palette(obj: QObject, **kwargs: dict):
@@ -204,8 +222,7 @@ def apply_font_properties(fontobj: QFont, **kwargs: dict):
     """
     if "fontsize" in kwargs and "pointSize" not in kwargs:
         kwargs["pointSize"] = kwargs.get("fontsize")
-    for _key in kwargs:
-        _name = f"set{_key[0].upper()}{_key[1:]}"
-        if hasattr(fontobj, _name):
-            _func = getattr(fontobj, _name)
-            _func(*_get_args_as_list(kwargs.get(_key)))
+    for _key, _value in kwargs.items():
+        _func = getattr(fontobj, _get_setter_name(_key), None)
+        if _func is not None:
+            _func(*_get_args_as_list(_value))
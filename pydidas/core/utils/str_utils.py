@@ -43,7 +43,6 @@ __all__ = [
 
 import os
 import random
-import re
 import string as _string_
 import sys
 import time
@@ -503,17 +502,20 @@ def _get_unformatted_lines(input_str: str, max_line_length: int = 60) -> list:
     result_lines : list
         The list with the individual lines.
     """
-    _words = [s for s in re.split(" |\n", input_str) if len(s) > 0]
+    _words = input_str.replace("\n", " ").split(" ")
     _result_lines = []
-    _current_str = _words.pop(0) if len(_words) > 0 else ""
-    while len(_words) > 0:
-        _newword = _words.pop(0)
-        if len(_current_str + _newword) + 1 > max_line_length:
-            _result_lines.append(_current_str)
-            _current_str = _newword
-        else:
-            _current_str = f"{_current_str} {_newword}"
-    _result_lines.append(_current_str)
+    _current_words = []
+    _current_len = -1
+    for _word in _words:
+        if len(_word) == 0:
+            continue
+        if _current_words and _current_len + len(_word) + 1 > max_line_length:
+            _result_lines.append(" ".join(_current_words))
+            _current_words = []
+            _current_len = -1
+        _current_words.append(_word)
+        _current_len += len(_word) + 1
+    _result_lines.append(" ".join(_current_words))
     return _result_lines
 
 
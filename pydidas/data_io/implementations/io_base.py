@@ -33,7 +33,7 @@ from numbers import Integral
 from pathlib import Path
 from typing import Union
 
-from numpy import amax, amin, ndarray
+from numpy import amax, amin, dtype, ndarray
 
 from ...core import Dataset, FileReadError
 from ...core.utils import rebin
@@ -173,8 +173,10 @@ class IoBase(metaclass=IoMaster):
             _data = _data[cls._roi_controller.roi]
         if _binning != 1:
             _data = rebin(_data, int(_binning))
-        if _return_type not in ("auto", _data.dtype):
-            _data = _data.astype(_return_type)
+        if _return_type != "auto":
+            _target_type = dtype(_return_type)
+            if _target_type != _data.dtype:
+                _data = _data.astype(_target_type, copy=False)
         return _data
 
     @staticmethod
@@ -72,27 +72,30 @@ def read_hdf5_dataset(filename, dataset="entry/data/data", axes=None):
     axes = axes if axes is not None else []
     with h5py.File(filename, "r") as _file:
         _ds = _file[dataset]
+        _ds_shape = _ds.shape
+        _ds_chunks = _ds.chunks
+        _ndim = len(_ds_shape)
 
-        limits = np.r_[[(0, _shape) for _shape in _ds.shape]]
+        limits = np.r_[[(0, _n) for _n in _ds_shape]]
         for i, _axis in enumerate(axes):
-            _lims = get_selection(_axis, _ds.shape[i])
-            if not (0 <= _lims[0] < _ds.shape[i] and 0 <= _lims[1] <= _ds.shape[i]):
+            _lims = get_selection(_axis, _ds_shape[i])
+            if not (0 <= _lims[0] < _ds_shape[i] and 0 <= _lims[1] <= _ds_shape[i]):
                 raise UserConfigError(
                     f"The specified limits {_lims} are out of bounds for axis {i}\n"
-                    f"of the hdf5 dataset {dataset}\nwith the shape {_ds.shape}."
+                    f"of the hdf5 dataset {dataset}\nwith the shape {_ds_shape}."
                 )
             limits[i] = _lims
 
-        if _ds.chunks is None:
+        if _ds_chunks is None:
             roi = tuple(slice(*limits[i1]) for i1 in range(limits.shape[0]))
             return _ds[roi]
 
         data = np.empty(np.diff(limits, axis=1)[:, 0], dtype=_ds.dtype)
 
-        slices_original = np.empty(_ds.ndim, dtype=object)
-        slices_target = np.empty(_ds.ndim, dtype=object)
-        for i in range(_ds.ndim):
-            _slices = get_slices(limits[i], _ds.chunks[i])
+        slices_original = np.empty(_ndim, dtype=object)
+        slices_target = np.empty(_ndim, dtype=object)
+        for i in range(_ndim):
+            _slices = get_slices(limits[i], _ds_chunks[i])
             slices_original[i] = _slices[0]
             slices_target[i] = _slices[1]
 
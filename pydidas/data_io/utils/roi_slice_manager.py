@@ -28,12 +28,10 @@ __status__ = "Production"
 __all__ = ["RoiSliceManager"]
 
 
-import copy
+import re
 from numbers import Integral
 from typing import Union
 
-from numpy import mod
-
 from ...core.utils import flatten_all
 
 
@@ -59,6 +57,56 @@ def error_msg(roi: object, exception: Exception = "") -> str:
     return _str
 
 
+def _merge_slices(slice1: slice, slice2: slice) -> slice:
+    """
+    Merge two slices into a single slice which is equivalent to applying both.
+
+    Parameters
+    ----------
+    slice1 : slice
+        The first (outer) slice.
+    slice2 : slice
+        The second slice which is applied to the result of the first slice.
+
+    Returns
+    -------
+    slice
+        The merged slice.
+
+    Raises
+    ------
+    ValueError
+        If negative stop indices are used.
+    """
+    # slice combine explained here for all cases:
+    # https://stackoverflow.com/questions/19257498/
+    # combining-two-slicing-operations
+    _step1 = 1 if slice1.step is None else slice1.step
+    _step2 = 1 if slice2.step is None else slice2.step
+    _stop1 = -1 if slice1.stop is None else slice1.stop
+    _stop2 = -1 if slice2.stop is None else slice2.stop
+    if _stop1 < 0 or _stop2 < 0:
+        raise ValueError(
+            "Cannot merge ROIs with negative indices. "
+            "Please change indices to positive numbers."
+        )
+    return slice(
+        slice1.start + _step1 * slice2.start,
+        min(slice1.start + _stop2 * _step1, _stop1),
+        _step1 * _step2,
+    )
+
+
+ROI_CACHE_SIZE = 64
+_ALLOWED_ROI_TYPES = (Integral, slice, str, type(None))
+_LEADING_INVALID_CHARS = re.compile(r"^[^0-9\-s]+")
+_TRAILING_INVALID_CHARS = re.compile(r"[^0-9\-)]+$")
+_ROI_STR_ENTRY = re.compile(
+    r"\s*(?:slice\(\s*([+-]?\d+)\s*,\s*([+-]?\d+)\s*(?:,\s*([+-]?\d+|None)\s*)?\)"
+    r"|([+-]?\d+))\s*(?:,|$)"
+)
+
+
 class RoiSliceManager:
     """
     The RoiSliceManager is used to create slice objects to crop images with a
@@ -85,6 +133,8 @@ class RoiSliceManager:
         initialization, this value can be supplied through the .roi property.
     """
 
+    _roi_cache = {}
+
     def __init__(self, **kwargs: dict):
         self._roi = None
         self._original_roi = None
@@ -230,27 +280,10 @@ class RoiSliceManager:
             If negative stop indices are used. Merging only supports positive
             (i.e. absolute) slices ranges.
         """
-        # slice combine explained here for all cases:
-        # https://stackoverflow.com/questions/19257498/
-        # combining-two-slicing-operations
-        _roi = []
-        for _axis in range(self._ndim):
-            _slice1 = self._original_roi[_axis]
-            _slice2 = self._roi[_axis]
-            _step1 = _slice1.step if _slice1.step is not None else 1
-            _step2 = _slice2.step if _slice2.step is not None else 1
-            _step = _step1 * _step2
-            _start = _slice1.start + _step1 * _slice2.start
-            _stop1 = _slice1.stop if _slice1.stop is not None else -1
-            _stop2 = _slice2.stop if _slice2.stop is not None else -1
-            if _stop1 < 0 or _stop2 < 0:
-                raise ValueError(
-                    "Cannot merge ROIs with negative indices. "
-                    "Please change indices to positive numbers."
-                )
-            _stop = min(_slice1.start + _stop2 * _step1, _stop1)
-            _roi.append(slice(_start, _stop, _step))
-        self._roi = tuple(_roi)
+        self._roi = tuple(
+            _merge_slices(_slice1, _slice2)
+            for _slice1, _slice2 in zip(self._original_roi, self._roi)
+        )
 
     def create_roi_slices(self):
         """
@@ -259,6 +292,12 @@ class RoiSliceManager:
         if self._roi_key is None:
             self._roi = None
             return
+        _previous_roi = self._roi
+        _cache_key = self._get_roi_cache_key()
+        if _cache_key in self._roi_cache:
+            _roi_key, self._roi = self._roi_cache[_cache_key]
+            self._roi_key = list(_roi_key)
+            return
         self._check_types_roi_key()
         self._check_types_roi_key_entries()
         self._convert_str_roi_key_entries()
@@ -266,6 +305,41 @@ class RoiSliceManager:
         self._convert_roi_key_to_slice_objects()
         if self.input_shape is not None:
             self._modulate_roi_keys()
+        if self._roi == _previous_roi:
+            self._roi = _previous_roi
+        if _cache_key is not None:
+            if len(self._roi_cache) >= ROI_CACHE_SIZE:
+                del self._roi_cache[next(iter(self._roi_cache))]
+            self._roi_cache[_cache_key] = (tuple(self._roi_key), self._roi)
+
+    def _get_roi_cache_key(self) -> Union[None, tuple]:
+        """
+        Get a hashable key for the current ROI key, dimension and input shape.
+
+        Returns
+        -------
+        Union[None, tuple]
+            The cache key or None if the input cannot be cached.
+        """
+        if isinstance(self._roi_key, str):
+            _key = self._roi_key
+        elif isinstance(self._roi_key, (list, tuple)):
+            _key = tuple(
+                (
+                    (slice, _item.start, _item.stop, _item.step)
+                    if isinstance(_item, slice)
+                    else (type(_item), _item)
+                )
+                for _item in self._roi_key
+            )
+        else:
+            return None
+        _cache_key = (_key, self._ndim, self._input_shape)
+        try:
+            hash(_cache_key)
+        except TypeError:
+            return None
+        return _cache_key
 
     def _check_types_roi_key(self):
         """
@@ -287,28 +361,46 @@ class RoiSliceManager:
 
     def _convert_str_roi_key(self):
         """
-        Convert a string ROI key to a list of entries and strip any leading
-        and trailing brackets and empty characters.
+        Convert a string ROI key to a list of integer and slice entries.
+
+        Any leading and trailing brackets and empty characters are stripped
+        before the string is parsed in a single pass.
+
+        Raises
+        ------
+        ValueError
+            If the string contains entries which are neither integers nor slices.
         """
+        _roi_str = self._roi_key
         self._strip_string_roi_key()
-        self._roi_key = [item.strip() for item in self._roi_key.split(",")]
+        _entries = []
+        _pos = 0
+        for _match in _ROI_STR_ENTRY.finditer(self._roi_key):
+            if _match.start() != _pos:
+                break
+            _start, _stop, _step, _int = _match.groups()
+            if _int is not None:
+                _entries.append(int(_int))
+            else:
+                _step = None if _step in (None, "None") else int(_step)
+                _entries.append(slice(int(_start), int(_stop), _step))
+            _pos = _match.end()
+        if _pos != len(self._roi_key):
+            raise ValueError(error_msg(_roi_str, "Cannot parse the string entries."))
+        self._roi_key = _entries
 
     def _strip_string_roi_key(self):
         """
         Strip a ROI key of type string of any leadind and trailing chars which
         do not belong (i.e. brackets, spaces etc.)
         """
-        _tmpstr = self._roi_key
-        _valid_chars = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "-"]
-        # strip leading chars:
+        _tmpstr = _LEADING_INVALID_CHARS.sub("", self._roi_key)
+        # strip trailing chars and closing brackets which are not part of a
+        # slice definition:
         while True:
-            if _tmpstr[0] in _valid_chars + ["s"]:
-                break
-            _tmpstr = _tmpstr[1:]
-        # strip trailing chars:
-        while True:
-            if _tmpstr[-1] in _valid_chars or (
-                (_tmpstr[-1] == ")" and _tmpstr.count(")") == _tmpstr.count("slice("))
+            _tmpstr = _TRAILING_INVALID_CHARS.sub("", _tmpstr)
+            if not _tmpstr.endswith(")") or _tmpstr.count(")") == _tmpstr.count(
+                "slice("
             ):
                 break
             _tmpstr = _tmpstr[:-1]
@@ -325,19 +417,12 @@ class RoiSliceManager:
         ValueError
             If datatypes apart from integer and slice are encountered.
         """
-        roi_dtypes = {
-            (Integral if issubclass(type(e), Integral) else type(e))
-            for e in self._roi_key
-        }
-        roi_dtypes.discard(Integral)
-        roi_dtypes.discard(slice)
-        roi_dtypes.discard(str)
-        roi_dtypes.discard(type(None))
-        if roi_dtypes != set():
-            _msg = error_msg(
-                self._roi_key, "Non-integer, non-slice datatypes encountered."
-            )
-            raise ValueError(_msg)
+        for _entry in self._roi_key:
+            if not isinstance(_entry, _ALLOWED_ROI_TYPES):
+                _msg = error_msg(
+                    self._roi_key, "Non-integer, non-slice datatypes encountered."
+                )
+                raise ValueError(_msg)
 
     def _convert_str_roi_key_entries(self):
         """
@@ -352,26 +437,27 @@ class RoiSliceManager:
             If the conversion of the string to a slice or interger object
             was not sucessful.
         """
-        _tmpkeys = copy.copy(self._roi_key)
+        _keys = iter(self._roi_key)
         _newkeys = []
         try:
-            while len(_tmpkeys) > 0:
-                key = _tmpkeys.pop(0)
+            for key in _keys:
                 if isinstance(key, (Integral, slice, type(None))):
                     _newkeys.append(key)
                     continue
                 if key.startswith("slice("):
                     _start = int(key[6:])
-                    _end = _tmpkeys.pop(0)
+                    _end = next(_keys)
                     if _end.endswith(")"):
                         _step = None
                         _end = _end.strip(")")
                     else:
-                        _step = _tmpkeys.pop(0).strip(")")
+                        _step = next(_keys).strip(")")
                         _step = int(_step) if _step != "None" else None
                     _newkeys.append(slice(_start, int(_end), _step))
                 else:
                     _newkeys.append(int(key))
+        except StopIteration:
+            raise ValueError(error_msg(self._roi_key, "Incomplete slice definition."))
         except ValueError as _ve:
             raise ValueError(error_msg(self._roi_key, _ve)) from _ve
         self._roi_key = _newkeys
@@ -408,19 +494,20 @@ class RoiSliceManager:
         ValueError
             If the conversion does not succeed.
         """
-        _roi = copy.copy(self._roi_key)
+        _roi = self._roi_key
+        _index = 0
         _out = []
         for _dim in range(1, self._ndim + 1):
             try:
-                if isinstance(_roi[0], (Integral, type(None))) and isinstance(
-                    _roi[1], (Integral, type(None))
+                if isinstance(_roi[_index], (Integral, type(None))) and isinstance(
+                    _roi[_index + 1], (Integral, type(None))
                 ):
-                    _index0 = _roi.pop(0)
-                    _index0 = _index0 if _index0 is not None else 0
-                    _index1 = _roi.pop(0)
-                    _out.append(slice(_index0, _index1))
-                elif isinstance(_roi[0], slice):
-                    _out.append(_roi.pop(0))
+                    _index0 = _roi[_index] if _roi[_index] is not None else 0
+                    _out.append(slice(_index0, _roi[_index + 1]))
+                    _index += 2
+                elif isinstance(_roi[_index], slice):
+                    _out.append(_roi[_index])
+                    _index += 1
                 else:
                     _msg = error_msg(
                         self._roi_key,
@@ -443,7 +530,7 @@ class RoiSliceManager:
             if value >= modulo:
                 value = modulo
             elif value < 0:
-                value = mod(value, modulo)
+                value = value % modulo
             return value
 
         _new_roi = []
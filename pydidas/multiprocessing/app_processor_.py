@@ -59,8 +59,8 @@ def app_processor(
     Parameters
     ----------
     input_queue : multiprocessing.Queue
-        The input queue which supplies the processor with indices to be
-        processed.
+        The input queue which supplies the processor with lists of indices to be
+        processed. A None entry signals that all tasks have been sent.
     output_queue : multiprocessing.Queue
         The queue for transmissing the results to the controlling thread.
     stop_queue : multiprocessing.Queue
@@ -89,6 +89,7 @@ def app_processor(
     _wait_for_output = kwargs.get("wait_for_output_queue", True)
     logger.setLevel(kwargs.get("logging_level", LOGGING_LEVEL))
     _carry_on = True
+    _tasks = []
     logger.debug("Started process")
     _app = app(app_params, slave_mode=True)
     _app._config = app_config
@@ -105,15 +106,16 @@ def app_processor(
             pass
         # run processing step
         if _carry_on:
-            try:
-                _arg = input_queue.get_nowait()
-            except queue.Empty:
-                time.sleep(0.005)
-                continue
-            if _arg is None:
-                logger.debug("Received queue empty signal in input queue.")
-                output_queue.put([None, None])
-                break
+            if len(_tasks) == 0:
+                try:
+                    _tasks = input_queue.get(timeout=0.005)
+                except queue.Empty:
+                    continue
+                if _tasks is None:
+                    logger.debug("Received queue empty signal in input queue.")
+                    output_queue.put([None, None])
+                    break
+            _arg = _tasks.pop(0)
             logger.debug('Received item "%s" from queue' % _arg)
             _app.multiprocessing_pre_cycle(_arg)
         _carry_on = _app.multiprocessing_carryon()
@@ -52,8 +52,8 @@ def processor(
     Parameters
     ----------
     input_queue : multiprocessing.Queue
-        The input queue which supplies the processor with indices to be
-        processed.
+        The input queue which supplies the processor with lists of indices to be
+        processed. A None entry signals that all tasks have been sent.
     output_queue : multiprocessing.Queue
         The queue for transmissing the results to the controlling thread.
     stop_queue : multiprocessing.Queue
@@ -80,10 +80,14 @@ def processor(
             pass
         # run processing step
         try:
-            _arg1 = input_queue.get(timeout=0.005)
-            if _arg1 is None:
-                output_queue.put([None, None])
-                break
+            _tasks = input_queue.get(timeout=0.01)
+        except queue.Empty:
+            continue
+        if _tasks is None:
+            output_queue.put([None, None])
+            break
+        _aborted = False
+        for _arg1 in _tasks:
             try:
                 _results = function(_arg1, *func_args, **func_kwargs)
             except Exception as ex:
@@ -92,7 +96,8 @@ def processor(
                 # becoming corrupted.
                 time.sleep(0.02)
                 aborted_queue.put(1)
+                _aborted = True
                 break
             output_queue.put([_arg1, _results])
-        except queue.Empty:
-            time.sleep(0.01)
+        if _aborted:
+            break
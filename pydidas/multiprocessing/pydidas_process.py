@@ -17,6 +17,11 @@
 
 """
 The PydidasProcess ignores the interrupt signal.
+
+Workers use the global multiprocessing start method, which is resolved when they
+are started. Users can opt into the "forkserver" method (and select modules to
+preload) with ``multiprocessing.set_start_method`` and
+``multiprocessing.set_forkserver_preload`` before starting any processing.
 """
 
 __author__ = "Malte Storm"
@@ -29,7 +29,9 @@ __all__ = ["WorkerController"]
 
 
 import multiprocessing as mp
+import os
 import time
+from collections import deque
 from collections.abc import Iterable
 from contextlib import contextmanager
 from numbers import Integral
@@ -47,6 +49,8 @@ from .pydidas_process import PydidasProcess
 
 logger = pydidas_logger()
 
+PROGRESS_EMIT_INTERVAL = 0.05
+
 
 class WorkerController(QtCore.QThread):
     """
@@ -70,6 +74,15 @@ class WorkerController(QtCore.QThread):
         The function arguments. The default is an empty tuple.
     func_kwargs : dict, optional
         Kwywords passed to the function. The default is an empty dictionary.
+    batch_size : int, optional
+        The maximum number of tasks which are sent to a worker in a single batch.
+        Larger batches reduce the communication overhead for many small tasks
+        but also reduce the granularity of the load balancing between workers.
+        The default is 1.
+    pin_workers : bool, optional
+        Flag to pin each worker process to a single CPU core (on systems which
+        support setting the CPU affinity). Pinned workers are not migrated by the
+        scheduler and keep their caches hot. The default is False.
     """
 
     sig_progress = QtCore.Signal(float)
@@ -81,6 +94,8 @@ class WorkerController(QtCore.QThread):
         function: Optional[type] = None,
         func_args: tuple = (),
         func_kwargs: Optional[dict] = None,
+        batch_size: int = 1,
+        pin_workers: bool = False,
     ):
         QtCore.QThread.__init__(self)
         self.flags = {
@@ -92,16 +107,28 @@ class WorkerController(QtCore.QThread):
         if n_workers is None:
             n_workers = PydidasQsettings().value("global/mp_n_workers", int)
         self._n_workers = n_workers
-        self._to_process = []
+        self._batch_size = batch_size
+        self._pin_workers = pin_workers
+        # The task deque is only filled by the calling thread and only emptied by
+        # the WorkerController thread. Single popleft calls are atomic in CPython
+        # and do not require a lock. The write lock only guards changes of the
+        # task list and reading the full list in cycle_pre_run.
+        self._to_process = deque()
         self._write_lock = QtCore.QReadWriteLock()
         self._workers = []
         self._workers_done = 0
+        self._idle_mutex = QtCore.QMutex()
+        self._idle_condition = QtCore.QWaitCondition()
         self._queues = {
             "send": mp.Queue(),
             "recv": mp.Queue(),
             "stop": mp.Queue(),
             "aborted": mp.Queue(),
         }
+        # direct references to the queues used in the processing loop:
+        self._send_queue = self._queues["send"]
+        self._recv_queue = self._queues["recv"]
+        self._aborted_queue = self._queues["aborted"]
         _worker_args = (
             self._queues["send"],
             self._queues["recv"],
@@ -116,6 +143,7 @@ class WorkerController(QtCore.QThread):
         }
         self._progress_done = 0
         self._progress_target = 0
+        self._last_progress_emit = 0.0
         if function is not None:
             self.change_function(
                 function, *func_args, *(func_kwargs if func_kwargs is not None else {})
@@ -166,6 +194,37 @@ class WorkerController(QtCore.QThread):
             raise ValueError("The number of workers must be an integer number.")
         self._n_workers = number
 
+    @property
+    def batch_size(self) -> int:
+        """
+        Get the maximum number of tasks sent to a worker in a single batch.
+
+        Returns
+        -------
+        int
+            The batch size.
+        """
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, number: int):
+        """
+        Change the maximum number of tasks sent to a worker in a single batch.
+
+        Parameters
+        ----------
+        number : int
+            The new batch size.
+
+        Raises
+        ------
+        ValueError
+            If number is not a positive integer.
+        """
+        if not (isinstance(number, Integral) and number > 0):
+            raise ValueError("The batch size must be a positive integer number.")
+        self._batch_size = number
+
     @property
     def progress(self) -> float:
         """
@@ -210,12 +269,15 @@ class WorkerController(QtCore.QThread):
         timeout : float, optional
             The maximum time to wait (in seconds). The default is 10.
         """
-        _t0 = time.time()
+        _t_end = time.monotonic() + timeout
+        self._idle_mutex.lock()
         while self.flags["active"]:
-            time.sleep(0.05)
-            if time.time() - _t0 >= timeout:
+            _remaining = _t_end - time.monotonic()
+            if _remaining <= 0:
                 logger.debug("WorkerController: Process finish timeout")
                 break
+            self._idle_condition.wait(self._idle_mutex, int(1000 * _remaining) + 1)
+        self._idle_mutex.unlock()
 
     def change_function(self, func: type, *args: tuple, **kwargs: dict):
         """
@@ -253,7 +315,7 @@ class WorkerController(QtCore.QThread):
         Reset and clear the list of tasks.
         """
         with self.write_lock():
-            self._to_process = []
+            self._to_process.clear()
 
     def restart(self):
         """
@@ -278,8 +340,7 @@ class WorkerController(QtCore.QThread):
         task : object
             The first argument for the processing function.
         """
-        with self.write_lock():
-            self._to_process.append(task)
+        self.add_tasks([task])
 
     def add_tasks(self, tasks: Iterable, are_stop_tasks: bool = False):
         """
@@ -298,10 +359,9 @@ class WorkerController(QtCore.QThread):
             disable updating the task target number.
         """
         with self.write_lock():
-            for task in tasks:
-                self._to_process.append(task)
-        if not are_stop_tasks:
-            self._progress_target += len(tasks)
+            self._to_process.extend(tasks)
+            if not are_stop_tasks:
+                self._progress_target += len(tasks)
 
     def finalize_tasks(self):
         """
@@ -311,8 +371,7 @@ class WorkerController(QtCore.QThread):
         to quit the loop once processing is done.
         """
         with self.write_lock():
-            for task in [None] * self._n_workers:
-                self._to_process.append(task)
+            self._to_process.extend([None] * self._n_workers)
         self.flags["stop_after_run"] = True
 
     @QtCore.Slot()
@@ -345,7 +404,6 @@ class WorkerController(QtCore.QThread):
             while self.flags["running"]:
                 while len(self._to_process) > 0:
                     self._put_next_task_in_queue()
-                time.sleep(0.001)
                 self._get_and_emit_all_queue_items()
                 self._check_if_workers_finished()
             if self.flags["active"]:
@@ -361,10 +419,9 @@ class WorkerController(QtCore.QThread):
         """
         self.flags["active"] = True
         self._progress_done = 0
-        _tmp_to_process = self._to_process[:]
-        while None in _tmp_to_process:
-            _tmp_to_process.remove(None)
-        self._progress_target = len(_tmp_to_process)
+        with self.write_lock():
+            self._progress_target = len(self._to_process) - self._to_process.count(None)
+        self._last_progress_emit = 0.0
         self._create_and_start_workers()
 
     def _create_and_start_workers(self):
@@ -385,41 +442,95 @@ class WorkerController(QtCore.QThread):
         for _i, _worker in enumerate(self._workers):
             _worker.start()
             logger.debug("WorkerController: Started worker %i" % _i)
+        if self._pin_workers and hasattr(os, "sched_setaffinity"):
+            self._pin_workers_to_cpus()
+
+    def _pin_workers_to_cpus(self):
+        """
+        Pin each worker process to a single of the available CPU cores.
+        """
+        _cpus = sorted(os.sched_getaffinity(0))
+        for _i, _worker in enumerate(self._workers):
+            _cpu = _cpus[_i % len(_cpus)]
+            try:
+                os.sched_setaffinity(_worker.pid, {_cpu})
+            except OSError:
+                logger.debug("WorkerController: Could not pin worker %i" % _i)
+                continue
+            logger.debug("WorkerController: Pinned worker %i to CPU %i" % (_i, _cpu))
 
     def _put_next_task_in_queue(self):
         """
-        Get the next task from the list and put it into the queue.
+        Get the next batch of tasks from the list and put it into the queue.
+
+        Tasks are sent as a list of up to batch_size items. Stop tasks (None) are
+        always sent individually to make sure that each worker receives exactly one.
         """
-        with self.write_lock():
-            _arg = self._to_process.pop(0)
-        self._queues["send"].put(_arg)
+        try:
+            _task = self._to_process.popleft()
+            _batch = None if _task is None else [_task]
+            while (
+                _batch is not None
+                and len(_batch) < self._batch_size
+                and len(self._to_process) > 0
+                and self._to_process[0] is not None
+            ):
+                _batch.append(self._to_process.popleft())
+        except IndexError:
+            # the task list has been reset in the meantime
+            return
+        self._send_queue.put(_batch)
 
-    def _get_and_emit_all_queue_items(self):
+    def _get_and_emit_all_queue_items(self, timeout: float = 0.01):
         """
         Get all items from the queue and emit them as signals.
+
+        The method blocks for up to timeout seconds while waiting for the first
+        item and returns once the queue has been emptied. Results are emitted
+        individually whereas the progress is emitted at most once per
+        PROGRESS_EMIT_INTERVAL, except for the final progress.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait for the first item (in seconds). The default
+            is 0.01.
         """
         while True:
             try:
-                _task, _results = self._queues["recv"].get_nowait()
-                if _task is None and _results is None:
-                    self._workers_done += 1
-                    logger.debug("WorkerController: Received None result - Worker done")
-                else:
-                    self.sig_results.emit(_task, _results)
-                    self._progress_done += 1
-                    self.sig_progress.emit(self.progress)
+                _task, _results = self._recv_queue.get(timeout=timeout)
             except Empty:
                 break
+            timeout = 0
+            if _task is None and _results is None:
+                self._workers_done += 1
+                logger.debug("WorkerController: Received None result - Worker done")
+            else:
+                self.sig_results.emit(_task, _results)
+                self._progress_done += 1
+                _now = time.monotonic()
+                if (
+                    _now - self._last_progress_emit >= PROGRESS_EMIT_INTERVAL
+                    or self._progress_done >= self._progress_target
+                ):
+                    self._last_progress_emit = _now
+                    self.sig_progress.emit(self.progress)
 
-    def _check_if_workers_finished(self):
+    def _check_if_workers_finished(self, timeout: float = 0):
         """
         Check if workers are all done.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait for each worker's aborted signal (in seconds).
+            The default is 0 which will not wait at all.
         """
-        if not self._queues["recv"].empty():
+        if not self._recv_queue.empty():
             return
         try:
             for _worker in self._workers:
-                self._queues["aborted"].get_nowait()
+                self._aborted_queue.get(block=timeout > 0, timeout=timeout)
                 self._workers_done += 1
                 logger.debug("WorkerController: Worker aborted processing.")
         except Empty:
@@ -455,7 +566,10 @@ class WorkerController(QtCore.QThread):
         for _worker in self._workers:
             _worker.join()
         self._workers = []
+        self._idle_mutex.lock()
         self.flags["active"] = False
+        self._idle_condition.wakeAll()
+        self._idle_mutex.unlock()
         logger.debug("WorkerController: Joined all workers")
 
     def join_queues(self):
@@ -472,6 +586,7 @@ class WorkerController(QtCore.QThread):
             _queue.close()
             _queue.join_thread()
         self._queues = {}
+        self._send_queue = self._recv_queue = self._aborted_queue = None
         logger.debug("WorkerController: Joined all queues.")
 
     def _wait_for_worker_finished_signals(self, timeout: float = 10):
@@ -492,7 +607,7 @@ class WorkerController(QtCore.QThread):
             return
         _tstart = time.time()
         while time.time() - _tstart <= timeout:
-            self._check_if_workers_finished()
+            self._check_if_workers_finished(timeout=0.01)
             if not self.flags["running"]:
                 return
         raise TimeoutError("Waiting too long for workers to finish.")
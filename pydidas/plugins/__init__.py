@@ -43,6 +43,7 @@ from .base_plugin import *
 from .base_proc_plugin import *
 from .plugin_collection import *
 from .plugin_getter_ import *
+from .plugin_registry import *
 
 # The base plugins with references to widgets must be imported last:
 from .base_fit_plugin import *
@@ -96,6 +97,11 @@ from . import plugin_getter_
 __all__.extend(plugin_getter_.__all__)
 del plugin_getter_
 
+from . import plugin_registry
+
+__all__.extend(plugin_registry.__all__)
+del plugin_registry
+
 from . import pyfai_integration_base
 
 __all__.extend(pyfai_integration_base.__all__)
@@ -69,6 +69,7 @@ class InputPlugin(BasePlugin):
         "roi_yhigh",
         "binning",
     ]
+    _metadata_param_keys = tuple(advanced_parameters) + ("hdf5_key",)
 
     def __init__(self, *args: tuple, **kwargs: dict):
         """
@@ -77,9 +78,26 @@ class InputPlugin(BasePlugin):
         BasePlugin.__init__(self, *args, **kwargs)
         self._SCAN = kwargs.get("scan", SCAN)
         self.filename_string = ""
-        self.__setup_image_magedata_manager()
+        self.__image_metadata = None
         self._original_input_shape = None
 
+    @property
+    def _image_metadata(self) -> ImageMetadataManager:
+        """
+        Get the ImageMetadataManager of the plugin.
+
+        The ImageMetadataManager is only created on first access to avoid the
+        setup cost for plugins which are never executed.
+
+        Returns
+        -------
+        ImageMetadataManager
+            The ImageMetadataManager instance.
+        """
+        if self.__image_metadata is None:
+            self.__setup_image_magedata_manager()
+        return self.__image_metadata
+
     def __setup_image_magedata_manager(self):
         """
         Setup the ImageMetadataManager to determine the shape of the final
@@ -89,11 +107,13 @@ class InputPlugin(BasePlugin):
         the processed data in the WorkflowTree.
         """
         _metadata_params = self.get_params(
-            "use_roi", "roi_xlow", "roi_xhigh", "roi_ylow", "roi_yhigh", "binning"
+            *[
+                _key
+                for _key in self._metadata_param_keys
+                if _key != "hdf5_key" or _key in self.params
+            ]
         )
-        if "hdf5_key" in self.params:
-            _metadata_params.append(self.get_param("hdf5_key"))
-        self._image_metadata = ImageMetadataManager(*_metadata_params)
+        self.__image_metadata = ImageMetadataManager(*_metadata_params)
 
     def calculate_result_shape(self):
         """
@@ -27,22 +27,69 @@ __copyright__ = "Copyright 2023 - 2024, Helmholtz-Zentrum Hereon"
 __license__ = "GPL-3.0-only"
 __maintainer__ = "Malte Storm"
 __status__ = "Production"
-__all__ = []
+__all__ = ["register_plugin"]
 
 
+import hashlib
 import importlib
 import inspect
+import json
+import os
+import sys
 import warnings
+import weakref
 from pathlib import Path
 from typing import Literal, Union
 
 from qtpy import QtCore
 
 from ..core import PydidasQsettingsMixin, UserConfigError
+from ..core.constants import BASE_PLUGIN, INPUT_PLUGIN, OUTPUT_PLUGIN, PROC_PLUGIN
 from ..core.utils import find_valid_python_files
 from . import GENERIC_PLUGIN_PATH
 
 
+# the class members of all imported plugin modules, stored with the file
+# modification time and size at import:
+_IMPORTED_MODULES = {}
+
+# the results of the check whether a class is a pydidas plugin. The classes are
+# only referenced weakly to allow replaced classes to be garbage collected:
+_PLUGIN_CLASS_CHECKS = weakref.WeakKeyDictionary()
+
+_PLUGIN_TYPE_KEYS = {
+    "base": BASE_PLUGIN,
+    "input": INPUT_PLUGIN,
+    "proc": PROC_PLUGIN,
+    "output": OUTPUT_PLUGIN,
+}
+
+
+def register_plugin(class_: type) -> type:
+    """
+    Declare a class as a pydidas plugin of its module.
+
+    This decorator is optional. If a plugin module declares any plugin with
+    it, the PluginRegistry will only register the declared classes instead of
+    checking all classes in the module namespace.
+
+    Parameters
+    ----------
+    class_ : type
+        The plugin class.
+
+    Returns
+    -------
+    type
+        The unchanged plugin class.
+    """
+    # plugin modules are not added to sys.modules, therefore the namespace of
+    # the calling module is used:
+    _module_globals = sys._getframe(1).f_globals
+    _module_globals.setdefault("__pydidas_plugins__", []).append(class_)
+    return class_
+
+
 class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
     """
     Class to hold references of plugins.
@@ -78,7 +125,11 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
         self._plugin_types = {}
         self._plugin_names = {}
         self._plugin_basic_types = {}
+        self._plugins_by_type = {}
         self._plugin_paths = []
+        self._plugin_index = {}
+        self._lazy_index = None
+        self._lazy_plugins = {}
         self._config = {
             "initial_plugin_path": self.__get_plugin_path_from_kwargs(**kwargs),
             "initialized": False,
@@ -133,13 +184,28 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
         """
         if self._config["initialized"]:
             return
+        _user_paths = self._get_user_plugin_paths()
         if self._config["use_generic_plugins"]:
             self.find_and_register_plugins(GENERIC_PLUGIN_PATH)
-        self.find_and_register_plugins(*self._get_user_plugin_paths())
+        self.find_and_register_plugins(*_user_paths)
         self._config["initialized"] = True
+        self._lazy_index = None
+        self._lazy_plugins = {}
+        self._store_plugin_index(self._get_generic_plugin_paths() + _user_paths)
         if self._config["must_emit_signal"]:
             self.sig_updated_plugins.emit()
 
+    def _get_generic_plugin_paths(self) -> list[Path]:
+        """
+        Get the generic plugin path, if generic plugins are used.
+
+        Returns
+        -------
+        list[Path]
+            A list with the generic plugin path or an empty list.
+        """
+        return [GENERIC_PLUGIN_PATH] if self._config["use_generic_plugins"] else []
+
     def _get_user_plugin_paths(self) -> list[Path]:
         """
         Get the user-set plugin paths.
@@ -199,15 +265,26 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
             Any number of file system paths.
         reload : bool, optional
             Flag to handle reloading of plugins if a plugin with an identical
-            name is encountered. If False, these plugins will be skipped.
+            name is encountered. If False, these plugins will be skipped and
+            paths which have not changed since they were last searched will
+            not be searched again.
         """
         for _path in plugin_paths:
             if not isinstance(_path, Path):
                 raise UserConfigError(
                     "Only pathlib.Paths are valid entries for plugin paths!"
                 )
-            if _path != Path() and _path.is_dir():
-                self._find_and_register_plugins_in_path(_path, reload)
+        _paths = [_path for _path in plugin_paths if _path != Path() and _path.is_dir()]
+        if not reload:
+            _paths = [_path for _path in _paths if not self._is_path_indexed(_path)]
+            if len(_paths) == 0:
+                return
+        for _path in _paths:
+            _file_states, _module_classes = self._scan_path_for_plugins(_path)
+            self._store_plugin_path(_path, store_in_qsettings=False)
+            self._register_plugins_in_path(_path, _file_states, _module_classes, reload)
+        if len(_paths) > 0:
+            self._store_plugin_paths_in_qsettings()
         if self._config["initialized"]:
             self.sig_updated_plugins.emit()
         else:
@@ -226,13 +303,225 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
             name is encountered. If False, these plugins will be skipped.
         """
         self._store_plugin_path(path)
-        _modules = self._get_valid_modules_and_filenames(path)
+        _file_states, _module_classes = self._scan_path_for_plugins(path)
+        self._register_plugins_in_path(path, _file_states, _module_classes, reload)
+
+    def _is_path_indexed(self, path: Path) -> bool:
+        """
+        Check whether the path has been searched and is unchanged since then.
+
+        Parameters
+        ----------
+        path : Path
+            The file system search path.
+
+        Returns
+        -------
+        bool
+            Flag whether the stored index of the path is still valid.
+        """
+        _record = self._plugin_index.get(str(path))
+        if _record is None:
+            return False
+        _file_states = self._get_file_states(path)
+        return _record["signature"] == self._get_path_signature(_file_states)
+
+    def _scan_path_for_plugins(
+        self, path: Path
+    ) -> tuple[dict[Path, tuple[int, int]], dict[str, tuple[Path, list]]]:
+        """
+        Import all modules in the given path and get their class members.
+
+        This method does not modify the registry.
+
+        Parameters
+        ----------
+        path : Path
+            The file system search path.
+
+        Returns
+        -------
+        file_states : dict[Path, tuple[int, int]]
+            The (modification time in ns, size) tuples for all files.
+        module_classes : dict[str, tuple[Path, list]]
+            The file path and class members for each module name.
+        """
+        _file_states = self._get_file_states(path)
+        _modules = self._get_valid_modules_and_filenames(path, list(_file_states))
+        _module_classes = {}
         for _modname, _file in _modules.items():
-            _class_members = self.__get_classes_in_module(_modname, _file)
+            _module_classes[_modname] = (
+                _file,
+                self.__get_classes_in_module(_modname, _file, _file_states[_file]),
+            )
+        return _file_states, _module_classes
+
+    def _register_plugins_in_path(
+        self,
+        path: Path,
+        file_states: dict[Path, tuple[int, int]],
+        module_classes: dict[str, tuple[Path, list]],
+        reload: bool = True,
+    ):
+        """
+        Register the plugin classes found in a path and store the path index.
+
+        Parameters
+        ----------
+        path : Path
+            The file system search path.
+        file_states : dict[Path, tuple[int, int]]
+            The (modification time in ns, size) tuples for all files.
+        module_classes : dict[str, tuple[Path, list]]
+            The file path and class members for each module name.
+        reload : bool, optional
+            Flag to handle reloading of plugins if a plugin with an identical
+            name is encountered. If False, these plugins will be skipped.
+        """
+        _record = {
+            "signature": self._get_path_signature(file_states),
+            "classes": {},
+            "plugin_names": {},
+        }
+        for _modname, (_file, _class_members) in module_classes.items():
             for _name, _cls in _class_members:
                 self.check_and_register_class(_cls, reload)
+                if (
+                    self.plugins.get(_cls.__name__) is _cls
+                    or self._plugin_basic_types.get(_cls.__name__) is _cls
+                ):
+                    _record["classes"][_cls.__name__] = [_modname, str(_file), _name]
+                    if not _cls.basic_plugin:
+                        _record["plugin_names"][_cls.plugin_name] = _cls.__name__
+        self._plugin_index[str(path)] = _record
+
+    @staticmethod
+    def _get_file_states(path: Path) -> dict[Path, tuple[int, int]]:
+        """
+        Get the modification times and sizes of all python files in the given path.
+
+        Parameters
+        ----------
+        path : Path
+            The file system path.
+
+        Returns
+        -------
+        dict[Path, tuple[int, int]]
+            The (modification time in ns, size) tuples for all files.
+        """
+        _states = {}
+        for _file in find_valid_python_files(path):
+            _stat = _file.stat()
+            _states[_file] = (_stat.st_mtime_ns, _stat.st_size)
+        return _states
+
+    @staticmethod
+    def _get_path_signature(file_states: dict[Path, tuple[int, int]]) -> str:
+        """
+        Get a signature of the given file states.
+
+        The signature includes the names, modification times and sizes of all
+        files and changes whenever any of the files is modified.
+
+        Parameters
+        ----------
+        file_states : dict[Path, tuple[int, int]]
+            The file states, as returned by _get_file_states.
+
+        Returns
+        -------
+        str
+            The signature hash.
+        """
+        _hash = hashlib.sha256()
+        for _file, (_mtime, _size) in sorted(file_states.items()):
+            _hash.update(f"{_file};{_mtime};{_size}\n".encode())
+        return _hash.hexdigest()
+
+    def _store_plugin_index(self, paths: list[Path]):
+        """
+        Store the index of plugin classes in the given paths in the QSettings.
 
-    def _store_plugin_path(self, plugin_path: Path, verbose: bool = False):
+        The index allows other processes to import single plugins without
+        scanning all plugin paths as long as no plugin file has been modified.
+
+        Parameters
+        ----------
+        paths : list[Path]
+            The plugin paths which have been scanned during initialization.
+        """
+        _index = {
+            str(_path): self._plugin_index[str(_path)]
+            for _path in paths
+            if str(_path) in self._plugin_index
+        }
+        self.q_settings_set("global/plugin_index", json.dumps(_index))
+
+    def _get_lazy_plugin_index(self) -> dict:
+        """
+        Get the stored plugin index, if it is still valid for all plugin paths.
+
+        Returns
+        -------
+        dict
+            The merged index with the "classes" and "plugin_names" entries. If the
+            stored index is invalid, both entries are empty.
+        """
+        if self._lazy_index is not None:
+            return self._lazy_index
+        self._lazy_index = {"classes": {}, "plugin_names": {}}
+        try:
+            _stored_index = json.loads(
+                self.q_settings_get("global/plugin_index", str, default="{}")
+            )
+        except ValueError:
+            return self._lazy_index
+        _merged_index = {"classes": {}, "plugin_names": {}}
+        for _path in self._get_generic_plugin_paths() + self._get_user_plugin_paths():
+            _record = _stored_index.get(str(_path))
+            if _record is None or _record["signature"] != self._get_path_signature(
+                self._get_file_states(_path)
+            ):
+                return self._lazy_index
+            _merged_index["classes"].update(_record["classes"])
+            _merged_index["plugin_names"].update(_record["plugin_names"])
+        self._lazy_index = _merged_index
+        return self._lazy_index
+
+    def _get_plugin_from_index(self, name: str) -> Union[None, type]:
+        """
+        Get a plugin from the stored index without initializing the registry.
+
+        Only the module which defines the plugin is imported.
+
+        Parameters
+        ----------
+        name : str
+            The class name of the plugin.
+
+        Returns
+        -------
+        Union[None, type]
+            The plugin class or None if it could not be found in the index.
+        """
+        if name in self._lazy_plugins:
+            return self._lazy_plugins[name]
+        if name in self.plugins or name in self._plugin_basic_types:
+            return None
+        _entry = self._get_lazy_plugin_index()["classes"].get(name)
+        if _entry is None:
+            return None
+        _modname, _file, _member_name = _entry
+        _class_members = dict(self.__get_classes_in_module(_modname, Path(_file)))
+        if _member_name not in _class_members:
+            return None
+        self._lazy_plugins[name] = _class_members[_member_name]
+        return self._lazy_plugins[name]
+
+    def _store_plugin_path(
+        self, plugin_path: Path, verbose: bool = False, store_in_qsettings: bool = True
+    ):
         """
         Store the plugin path.
 
@@ -242,6 +531,10 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
             The plugin path.
         verbose : bool, optional
             Keyword to toggle printed warnings. The default is False
+        store_in_qsettings : bool, optional
+            Flag to write the updated plugin paths to the QSettings. This can be
+            disabled to write the paths only once after storing multiple paths.
+            The default is True.
         """
         if plugin_path in self._plugin_paths + [GENERIC_PLUGIN_PATH]:
             if verbose and plugin_path in self._plugin_paths:
@@ -249,11 +542,20 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
             return
         if plugin_path.exists():
             self._plugin_paths.append(plugin_path)
+        if store_in_qsettings:
+            self._store_plugin_paths_in_qsettings()
+
+    def _store_plugin_paths_in_qsettings(self):
+        """
+        Write all registered plugin paths to the QSettings.
+        """
         _paths = ";;".join(str(_path) for _path in self._plugin_paths)
         self.q_settings_set("user/plugin_path", _paths)
 
     @staticmethod
-    def _get_valid_modules_and_filenames(path: Union[Path, str]) -> dict[str, Path]:
+    def _get_valid_modules_and_filenames(
+        path: Union[Path, str], files: Union[None, list[Path]] = None
+    ) -> dict[str, Path]:
         """
         Get all module names in a specified path (including subdirectories).
 
@@ -261,6 +563,9 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
         ----------
         path : Union[str, Path]
             The file system path.
+        files : Union[None, list[Path]], optional
+            The python files in the path, if they have already been searched. If
+            None, the path will be searched. The default is None.
 
         Returns
         -------
@@ -269,7 +574,7 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
         """
         if isinstance(path, str):
             path = Path(path)
-        _files = find_valid_python_files(path)
+        _files = find_valid_python_files(path) if files is None else files
         _dirpath = path if path.is_dir() else path.parent
         _modules = {
             ".".join(_file.relative_to(_dirpath).parts).removesuffix(".py"): _file
@@ -278,16 +583,28 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
         return _modules
 
     @staticmethod
-    def __get_classes_in_module(modname: str, filepath: Path) -> list[tuple[str, type]]:
+    def __get_classes_in_module(
+        modname: str,
+        filepath: Union[str, Path],
+        file_state: Union[None, tuple[int, int]] = None,
+    ) -> list[tuple[str, type]]:
         """
         Import a module from a file and get all class members of the module.
 
+        Modules are only executed once per process. They are only executed again
+        if the file has been modified in the meantime. If the module declares
+        its plugins with the register_plugin decorator, only the declared
+        plugins are returned.
+
         Parameters
         ----------
         modname : str
             The registration name of the module
-        filepath : str
+        filepath : Union[str, Path]
             The full file path of the module.
+        file_state : Union[None, tuple[int, int]], optional
+            The modification time (in ns) and size of the file, if known. If None,
+            the file state will be read from the file system. The default is None.
 
         Returns
         -------
@@ -295,11 +612,25 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
             A list with class members with entries for each class in the
             form of (name, class).
         """
+        if file_state is None:
+            _stat = os.stat(filepath)
+            file_state = (_stat.st_mtime_ns, _stat.st_size)
+        _key = (modname, str(filepath))
+        if _key in _IMPORTED_MODULES and _IMPORTED_MODULES[_key][0] == file_state:
+            return _IMPORTED_MODULES[_key][1]
         spec = importlib.util.spec_from_file_location(modname, filepath)
         tmp_module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(tmp_module)
-        cls_members = inspect.getmembers(tmp_module, inspect.isclass)
-        del spec, tmp_module
+        _declared_plugins = getattr(tmp_module, "__pydidas_plugins__", None)
+        if _declared_plugins is not None:
+            cls_members = [(_cls.__name__, _cls) for _cls in _declared_plugins]
+        else:
+            cls_members = sorted(
+                (_name, _item)
+                for _name, _item in vars(tmp_module).items()
+                if isinstance(_item, type)
+            )
+        _IMPORTED_MODULES[_key] = (file_state, cls_members)
         return cls_members
 
     def check_and_register_class(self, class_: type, reload: bool = False):
@@ -314,18 +645,20 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
             Flag to enable reloading of plugins. If True, new plugins will
             overwrite older stored plugins. The default is False.
         """
-        _class_bases = [
-            ".".join([_cls.__module__, _cls.__name__])
-            for _cls in inspect.getmro(class_)
-        ]
-        if "pydidas.plugins.base_plugin.BasePlugin" not in _class_bases:
+        if class_ not in _PLUGIN_CLASS_CHECKS:
+            _PLUGIN_CLASS_CHECKS[class_] = "pydidas.plugins.base_plugin.BasePlugin" in [
+                ".".join([_cls.__module__, _cls.__name__])
+                for _cls in inspect.getmro(class_)
+            ]
+        if not _PLUGIN_CLASS_CHECKS[class_]:
             return
         if class_.basic_plugin is True:
             self._plugin_basic_types[class_.__name__] = class_
             return
-        if class_.__name__ not in self.plugins:
+        _registered_class = self.plugins.get(class_.__name__)
+        if _registered_class is None:
             self.__add_new_class(class_)
-        elif reload:
+        elif reload and _registered_class is not class_:
             self.remove_plugin_from_collection(class_)
             self.__add_new_class(class_)
 
@@ -353,6 +686,8 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
             -1 if class_.basic_plugin else class_.plugin_type
         )
         self._plugin_names[class_.plugin_name] = class_.__name__
+        _type = self._plugin_types[class_.__name__]
+        self._plugins_by_type.setdefault(_type, {})[class_.__name__] = class_
 
     def remove_plugin_from_collection(self, class_: type):
         """
@@ -365,7 +700,8 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
         """
         if class_.__name__ in self.plugins:
             del self.plugins[class_.__name__]
-            del self._plugin_types[class_.__name__]
+            _type = self._plugin_types.pop(class_.__name__)
+            del self._plugins_by_type[_type][class_.__name__]
             del self._plugin_names[class_.plugin_name]
 
     def get_all_plugin_names(self) -> list[str]:
@@ -394,9 +730,15 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
         plugin : pydidas.plugins.BasePlugin
             The Plugin class.
         """
+        if not self._config["initialized"]:
+            _name = self._get_lazy_plugin_index()["plugin_names"].get(plugin_name)
+            _plugin = None if _name is None else self._get_plugin_from_index(_name)
+            if _plugin is not None:
+                return _plugin
         self.verify_is_initialized()
-        if plugin_name in self._plugin_names:
-            return self.plugins[self._plugin_names[plugin_name]]
+        _name = self._plugin_names.get(plugin_name)
+        if _name is not None:
+            return self.plugins[_name]
         raise KeyError(
             f'No plugin with plugin_name "{plugin_name}" has been' " registered!"
         )
@@ -415,11 +757,14 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
         plugin : pydidas.plugins.BasePlugin
             The Plugin class.
         """
+        if not self._config["initialized"]:
+            _plugin = self._get_plugin_from_index(name)
+            if _plugin is not None:
+                return _plugin
         self.verify_is_initialized()
-        if name in self.plugins:
-            return self.plugins[name]
-        if name in self._plugin_basic_types:
-            return self._plugin_basic_types[name]
+        _plugin = self.plugins.get(name, self._plugin_basic_types.get(name))
+        if _plugin is not None:
+            return _plugin
         raise KeyError(f'No plugin with name "{name}" has been registered!')
 
     def get_all_plugins(self) -> list[type]:
@@ -453,12 +798,8 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
         self.verify_is_initialized()
         if plugin_type == "base":
             return list(self._plugin_basic_types.values())
-        _key = {"base": -1, "input": 0, "proc": 1, "output": 2}[plugin_type]
-        _res = []
-        for _name, _plugin in self.plugins.items():
-            if self._plugin_types[_name] == _key:
-                _res.append(_plugin)
-        return _res
+        _plugins = self._plugins_by_type.get(_PLUGIN_TYPE_KEYS[plugin_type], {})
+        return list(_plugins.values())
 
     @property
     def registered_paths(self) -> list[Path]:
@@ -496,9 +837,7 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
             )
         self._plugin_paths.remove(path)
         self._config["initial_plugin_path"] = list(self._plugin_paths)
-        self.q_settings_set(
-            "user/plugin_path", ";;".join(str(_path) for _path in self._plugin_paths)
-        )
+        self._store_plugin_paths_in_qsettings()
         self.clear_collection(confirmation=True)
         self.verify_is_initialized()
 
@@ -533,7 +872,11 @@ class PluginRegistry(QtCore.QObject, PydidasQsettingsMixin):
             self.plugins = {}
             self._plugin_types = {}
             self._plugin_names = {}
+            self._plugins_by_type = {}
             self._plugin_paths = []
+            self._plugin_index = {}
+            self._lazy_index = None
+            self._lazy_plugins = {}
             self._config["initialized"] = False
             self.sig_updated_plugins.emit()
             return
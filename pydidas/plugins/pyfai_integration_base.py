@@ -28,15 +28,15 @@ __status__ = "Production"
 __all__ = ["pyFAIintegrationBase"]
 
 
+import functools
 import multiprocessing as mp
 import os
 import pathlib
+import stat
 from typing import Literal, Union
 
 import numpy as np
-from pyFAI.azimuthalIntegrator import AzimuthalIntegrator
 from qtpy import QtWidgets
-from silx.opencl.common import OpenCL
 
 from ..contexts import DiffractionExperimentContext
 from ..core import UserConfigError, get_generic_param_collection
@@ -56,11 +56,65 @@ from .base_proc_plugin import ProcPlugin
 logger = pydidas_logger()
 
 
-OCL = OpenCL()
-
 PI_STR = GREEK_ASCII_TO_UNI["pi"]
 
 
+@functools.cache
+def _get_opencl() -> object:
+    """
+    Get the silx OpenCL instance.
+
+    The OpenCL platforms are only probed when an OpenCL integration method is
+    used for the first time.
+
+    Returns
+    -------
+    silx.opencl.common.OpenCL
+        The OpenCL instance.
+    """
+    from silx.opencl.common import OpenCL
+
+    return OpenCL()
+
+
+# the AzimuthalIntegrators shared between plugins, stored with a key of the
+# experiment hash, the mask file state and the azimuthal range:
+AI_CACHE_SIZE = 8
+_AI_CACHE = {}
+
+# the loaded detector masks, stored with the file modification time and size:
+MASK_CACHE_SIZE = 8
+_MASK_CACHE = {}
+
+
+def _import_mask(filename: pathlib.Path, file_state: tuple[int, int]) -> np.ndarray:
+    """
+    Import a mask file and reuse the stored data if the file is unchanged.
+
+    At most MASK_CACHE_SIZE masks are stored and the oldest mask is removed
+    first.
+
+    Parameters
+    ----------
+    filename : pathlib.Path
+        The mask filename.
+    file_state : tuple[int, int]
+        The modification time in ns and the size of the mask file.
+
+    Returns
+    -------
+    np.ndarray
+        A copy of the mask data.
+    """
+    _key = str(filename)
+    if _key not in _MASK_CACHE or _MASK_CACHE[_key][0] != file_state:
+        _MASK_CACHE.pop(_key, None)
+        if len(_MASK_CACHE) >= MASK_CACHE_SIZE:
+            del _MASK_CACHE[next(iter(_MASK_CACHE))]
+        _MASK_CACHE[_key] = (file_state, import_data(filename))
+    return _MASK_CACHE[_key][1].copy()
+
+
 class pyFAIintegrationBase(ProcPlugin):
     """
     Provide basic functionality for the concrete integration plugins.
@@ -96,47 +150,84 @@ class pyFAIintegrationBase(ProcPlugin):
         self._EXP = kwargs.pop("diffraction_exp", DiffractionExperimentContext())
         super().__init__(*args, **kwargs)
         self._ai = None
+        self._ai_key = None
         self._ai_params = {}
-        self._exp_hash = -1
         self._mask = None
+        self._mask_key = None
         self._config["custom_mask"] = False
 
     def pre_execute(self):
         """
         Check and load the mask and set up the AzimuthalIntegrator.
+
+        AzimuthalIntegrators are shared between plugins with identical geometry,
+        mask and azimuthal range to allow pyFAI to reuse its integration engines.
         """
         self.load_and_set_mask()
-        if self._exp_hash != hash(self._EXP):
-            _lambda_in_A = self._EXP.get_param_value("xray_wavelength")
-            self._ai = AzimuthalIntegrator(
-                dist=self._EXP.get_param_value("detector_dist"),
-                poni1=self._EXP.get_param_value("detector_poni1"),
-                poni2=self._EXP.get_param_value("detector_poni2"),
-                rot1=self._EXP.get_param_value("detector_rot1"),
-                rot2=self._EXP.get_param_value("detector_rot2"),
-                rot3=self._EXP.get_param_value("detector_rot3"),
-                detector=self._EXP.get_detector(),
-                wavelength=1e-10 * _lambda_in_A,
-            )
-            self._exp_hash = hash(self._EXP)
-        if self._mask is not None:
-            self._ai.set_mask(self._mask)
-        self._adjust_integration_discontinuity()
+        _azi_range = self.get_azimuthal_range_in_rad()
+        self._ai_key = (hash(self._EXP), self._mask_key, _azi_range)
+        if self._ai_key not in _AI_CACHE:
+            if len(_AI_CACHE) >= AI_CACHE_SIZE:
+                del _AI_CACHE[next(iter(_AI_CACHE))]
+            _AI_CACHE[self._ai_key] = self._create_integrator()
+        self._ai = _AI_CACHE[self._ai_key]
+        self._config["custom_mask"] = False
+        self._adjust_integration_discontinuity(_azi_range)
         self._prepare_pyfai_method()
 
+    def _create_integrator(self) -> object:
+        """
+        Create a new AzimuthalIntegrator with the current geometry and mask.
+
+        pyFAI's integrator module is only imported when the first integrator is
+        created to keep it out of the import of pydidas.plugins.
+
+        Returns
+        -------
+        pyFAI.azimuthalIntegrator.AzimuthalIntegrator
+            The new integrator.
+        """
+        from pyFAI.azimuthalIntegrator import AzimuthalIntegrator
+
+        _lambda_in_A = self._EXP.get_param_value("xray_wavelength")
+        _ai = AzimuthalIntegrator(
+            dist=self._EXP.get_param_value("detector_dist"),
+            poni1=self._EXP.get_param_value("detector_poni1"),
+            poni2=self._EXP.get_param_value("detector_poni2"),
+            rot1=self._EXP.get_param_value("detector_rot1"),
+            rot2=self._EXP.get_param_value("detector_rot2"),
+            rot3=self._EXP.get_param_value("detector_rot3"),
+            detector=self._EXP.get_detector(),
+            wavelength=1e-10 * _lambda_in_A,
+        )
+        if self._mask is not None:
+            _ai.set_mask(self._mask)
+        return _ai
+
     def load_and_set_mask(self):
         """
         Load and store the mask.
 
         If defined (and the file exists), the locally defined detector mask
         Parameter will be used. If not, the global QSetting detector mask
-        will be used.
+        will be used. The mask file is only read again if it has been
+        modified.
+
+        The mask key identifies the mask by the file name and state and the
+        legacy image operations applied to it.
         """
         self._mask = None
+        self._mask_key = None
         _mask_file = self._EXP.get_param_value("detector_mask_file")
         if _mask_file != pathlib.Path():
-            if os.path.isfile(_mask_file):
-                self._mask = import_data(_mask_file)
+            try:
+                _stat = os.stat(_mask_file)
+            except OSError:
+                _stat = None
+            if _stat is not None and stat.S_ISREG(_stat.st_mode):
+                _file_state = (_stat.st_mtime_ns, _stat.st_size)
+                self._mask = _import_mask(_mask_file, _file_state)
+                self._mask_key = (str(_mask_file), _file_state)
             else:
                 raise UserConfigError(
                     f"Cannot load detector mask: No file with the name \n{_mask_file}"
@@ -145,6 +236,10 @@ class pyFAIintegrationBase(ProcPlugin):
         if self._mask is not None and len(self._legacy_image_ops) > 0:
             _roi, _bin = self.get_single_ops_from_legacy()
             self._mask = np.where(rebin2d(self._mask[_roi], _bin) > 0, 1, 0)
+            self._mask_key += (
+                tuple((_slice.start, _slice.stop, _slice.step) for _slice in _roi),
+                _bin,
+            )
 
     def _prepare_pyfai_method(self):
         """
@@ -156,10 +251,11 @@ class pyFAIintegrationBase(ProcPlugin):
         if _method[2] != "opencl":
             return
         _name = mp.current_process().name
-        _platforms = [_platform.name for _platform in OCL.platforms]
+        _ocl = _get_opencl()
+        _platforms = [_platform.name for _platform in _ocl.platforms]
         if "NVIDIA CUDA" in _platforms and _name.startswith("pydidas_"):
             _index = int(_name.split("-")[1])
-            _platform = OCL.get_platform("NVIDIA CUDA")
+            _platform = _ocl.get_platform("NVIDIA CUDA")
             _n_device = len(_platform.devices)
             _device = _index % _n_device
             _method = _method + ((_platform.id, _device),)
@@ -243,15 +339,19 @@ class pyFAIintegrationBase(ProcPlugin):
             )
         return None
 
-    def _adjust_integration_discontinuity(self):
+    def _adjust_integration_discontinuity(self, azi_range: Union[None, tuple]):
         """
         Check the position of the integration discontinuity and adjust it according
         to the integration bounds.
+
+        Parameters
+        ----------
+        azi_range : Union[None, tuple[float, float]]
+            The azimuthal range in radians, as given by get_azimuthal_range_in_rad.
         """
-        _range = self.get_azimuthal_range_in_rad()
-        if _range is None:
+        if azi_range is None:
             return
-        _low, _high = _range
+        _low, _high = azi_range
         if _high - _low > 2 * np.pi:
             raise UserConfigError(
                 "The integration range is larger than a full circle! "
@@ -380,7 +480,12 @@ class pyFAIintegrationBase(ProcPlugin):
             self._config["custom_mask"] = False
         else:
             return
-        if hasattr(self, "_ai"):
+        if self._ai is not None:
+            if _AI_CACHE.get(self._ai_key) is self._ai:
+                # do not modify the mask of an AzimuthalIntegrator shared with
+                # other plugins:
+                self._ai = self._create_integrator()
+                self._adjust_integration_discontinuity(self._ai_key[2])
             self._ai.set_mask(_mask)
         if hasattr(self, "_ais"):
             for _ai in self._ais:
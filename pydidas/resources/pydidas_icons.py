@@ -34,6 +34,7 @@ __all__ = [
 ]
 
 
+import functools
 import os
 from pathlib import Path
 
@@ -43,6 +44,7 @@ from qtpy import QtGui
 ICON_PATH = str(Path(__file__).parent.joinpath("icons"))
 
 
+@functools.cache
 def pydidas_icon() -> QtGui.QIcon:
     """
     Get the pydidas icon.
@@ -55,6 +57,7 @@ def pydidas_icon() -> QtGui.QIcon:
     return QtGui.QIcon(os.path.join(ICON_PATH, "pydidas_snakes.svg"))
 
 
+@functools.cache
 def pydidas_icon_with_bg() -> QtGui.QIcon:
     """
     Get the pydidas icon with a white background (with rounded corners).
@@ -67,6 +70,7 @@ def pydidas_icon_with_bg() -> QtGui.QIcon:
     return QtGui.QIcon(os.path.join(ICON_PATH, "pydidas_snakes_w_bg.svg"))
 
 
+@functools.cache
 def pydidas_error_icon() -> QtGui.QIcon:
     """
     Get the icon for a pydidas error.
@@ -79,6 +83,7 @@ def pydidas_error_icon() -> QtGui.QIcon:
     return QtGui.QIcon(os.path.join(ICON_PATH, "pydidas_error.svg"))
 
 
+@functools.cache
 def pydidas_error_icon_with_bg() -> QtGui.QIcon:
     """
     Get the icon for a pydidas error with a white background.
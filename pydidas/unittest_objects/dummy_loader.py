@@ -70,6 +70,8 @@ class DummyLoader(InputPlugin):
         InputPlugin.__init__(self, *args, **kwargs)
         self._preexecuted = False
         self._config["input_available"] = 12
+        self._rng = np.random.default_rng()
+        self._image_shape = None
 
     def __reduce__(self):
         """
@@ -142,14 +144,22 @@ class DummyLoader(InputPlugin):
         """
         Run the pre-execution routine and store a variable that this method
         has been called.
+
+        A new random number generator is created to prevent copies of the
+        Plugin in different processes from creating identical data.
         """
         self._preexecuted = True
+        self._rng = np.random.default_rng()
+        self._image_shape = (
+            self.get_param_value("image_height"),
+            self.get_param_value("image_width"),
+        )
 
     def execute(self, index: int, **kwargs: dict) -> tuple[Dataset, dict]:
         """
         Execute the actual computations.
 
-        This method will create a new Dataset with random data.
+        This method will create a new Dataset with random float32 data.
 
         Parameters
         ----------
@@ -166,9 +176,13 @@ class DummyLoader(InputPlugin):
         kwargs : dict
             The updated input kwargs dictionary.
         """
-        _width = self.get_param_value("image_width")
-        _height = self.get_param_value("image_height")
-        _data = np.random.random((_height, _width))
+        _shape = self._image_shape
+        if _shape is None:
+            _shape = (
+                self.get_param_value("image_height"),
+                self.get_param_value("image_width"),
+            )
+        _data = self._rng.random(_shape, dtype=np.float32)
         _data[_data == 0] = 0.0001
         kwargs.update(dict(index=index))
         return Dataset(_data), kwargs
@@ -38,11 +38,6 @@ from qtpy import QtCore, QtWidgets
 
 from ...core import UserConfigError
 from ...core.constants import PYDIDAS_COLORS
-from ...core.utils import (
-    calc_points_on_ellipse,
-    fit_circle_from_points,
-    fit_detector_center_and_tilt_from_points,
-)
 from ...data_io import import_data
 
 
@@ -50,6 +45,10 @@ BaseFrame = NewType("BaseFrame", QtWidgets.QWidget)
 PydidasPlot2d = NewType("PydidasPlot2d", QtWidgets.QWidget)
 PointsForBeamcenterWidget = NewType("PointsForBeamcenterWidget", QtWidgets.QWidget)
 
+_CIRCLE_THETA = np.linspace(0, 2 * np.pi, num=73, endpoint=True)
+_CIRCLE_COS_THETA = np.cos(_CIRCLE_THETA)
+_CIRCLE_SIN_THETA = np.sin(_CIRCLE_THETA)
+
 
 class ManuallySetBeamcenterController(QtCore.QObject):
     """
@@ -95,6 +94,8 @@ class ManuallySetBeamcenterController(QtCore.QObject):
         self._points_for_bc = point_table
         self._mask = None
         self._mask_hash = -1
+        self._circle_outline_x = np.empty(_CIRCLE_THETA.size)
+        self._circle_outline_y = np.empty(_CIRCLE_THETA.size)
         self._plot.sigPlotSignal.connect(self._process_plot_signal)
         self._points_for_bc.sig_new_selection.connect(self.__new_points_selected)
         self._points_for_bc.sig_remove_points.connect(self.__remove_points_from_plot)
@@ -404,6 +405,8 @@ class ManuallySetBeamcenterController(QtCore.QObject):
         """
         Fit the beamcenter through a circle.
         """
+        from ...core.utils import fit_circle_from_points
+
         _x, _y = self.points
         if _x.size < 3:
             raise UserConfigError(
@@ -412,13 +415,14 @@ class ManuallySetBeamcenterController(QtCore.QObject):
             )
         _cx, _cy, _r = fit_circle_from_points(_x, _y)
         self._set_beamcenter_marker((_cx, _cy))
-        self._master.set_param_value_and_widget("beamcenter_x", np.round(_cx, 4))
-        self._master.set_param_value_and_widget("beamcenter_y", np.round(_cy, 4))
+        self._master.set_param_value_and_widget("beamcenter_x", round(float(_cx), 4))
+        self._master.set_param_value_and_widget("beamcenter_y", round(float(_cy), 4))
         self._toggle_beamcenter_is_set(True)
-        _theta = np.linspace(0, 2 * np.pi, num=73, endpoint=True)
-        _x = np.cos(_theta) * _r + _cx
-        _y = np.sin(_theta) * _r + _cy
-        self._plot_beamcenter_outline(_x, _y)
+        np.multiply(_CIRCLE_COS_THETA, _r, out=self._circle_outline_x)
+        self._circle_outline_x += _cx
+        np.multiply(_CIRCLE_SIN_THETA, _r, out=self._circle_outline_y)
+        self._circle_outline_y += _cy
+        self._plot_beamcenter_outline(self._circle_outline_x, self._circle_outline_y)
         self.sig_selected_beamcenter.emit()
 
     @QtCore.Slot()
@@ -426,6 +430,11 @@ class ManuallySetBeamcenterController(QtCore.QObject):
         """
         Fit the beamcenter through an ellipse.
         """
+        from ...core.utils import (
+            calc_points_on_ellipse,
+            fit_detector_center_and_tilt_from_points,
+        )
+
         _x, _y = self.points
         if _x.size < 5:
             raise UserConfigError(
@@ -440,8 +449,8 @@ class ManuallySetBeamcenterController(QtCore.QObject):
             _coeffs,
         ) = fit_detector_center_and_tilt_from_points(_x, _y)
         self._set_beamcenter_marker((_cx, _cy))
-        self._master.set_param_value_and_widget("beamcenter_x", np.round(_cx, 4))
-        self._master.set_param_value_and_widget("beamcenter_y", np.round(_cy, 4))
+        self._master.set_param_value_and_widget("beamcenter_x", round(float(_cx), 4))
+        self._master.set_param_value_and_widget("beamcenter_y", round(float(_cy), 4))
         _x, _y = calc_points_on_ellipse(_coeffs)
         self._plot_beamcenter_outline(_x, _y)
         self.sig_selected_beamcenter.emit()
@@ -27,6 +27,7 @@ __status__ = "Production"
 __all__ = ["ErrorMessageBox"]
 
 
+import functools
 import os
 
 from qtpy import QtCore, QtGui, QtWidgets
@@ -45,6 +46,34 @@ from ..factory import CreateWidgetsMixIn
 from ..scroll_area import ScrollArea
 
 
+_NOTE_TEMPLATE = (
+    "Please report the bug online using the form available on:\n"
+    "\thttps://pydidas.hereon.de/\n\n"
+    "You can simply use the button on the bottom left to coyy the\n"
+    "exception trace to your clipboard and open the webpage in your"
+    " default browser."
+    "\n\nA log has been written to:\n\t{logfile}\n\n"
+    + "-" * 20
+    + "\nException trace:\n\n{text}"
+)
+
+
+@functools.cache
+def _get_logfile() -> str:
+    """
+    Get the path of the exception logfile.
+
+    The path is only determined once because the logging directory does not
+    change while pydidas is running.
+
+    Returns
+    -------
+    str
+        The full path of the exception logfile.
+    """
+    return os.path.join(get_logging_dir(), "pydidas_exception.log")
+
+
 class ErrorMessageBox(QtWidgets.QDialog, CreateWidgetsMixIn):
     """
     Show a dialogue box with exception information.
@@ -98,14 +127,18 @@ class ErrorMessageBox(QtWidgets.QDialog, CreateWidgetsMixIn):
             gridPos=(3, 0, 1, 1),
         )
 
+        # The svg logo is only loaded when the dialogue is shown. Until then,
+        # an empty placeholder widget reserves its space:
+        self._icon_size = _char_height * 9
         self.add_any_widget(
             "icon",
-            logos.pydidas_error_svg(),
-            fixedHeight=_char_height * 9,
-            fixedWidth=_char_height * 9,
+            QtWidgets.QWidget(),
+            fixedHeight=self._icon_size,
+            fixedWidth=self._icon_size,
             gridPos=(0, 2, 2, 1),
             layout_kwargs={"alignment": ALIGN_TOP_RIGHT},
         )
+        self._icon_loaded = False
         self.create_button(
             "button_okay",
             "Acknowledge",
@@ -132,6 +165,26 @@ class ErrorMessageBox(QtWidgets.QDialog, CreateWidgetsMixIn):
             self._widgets[_name].setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
         self.setTabOrder(self._widgets["button_copy"], self._widgets["button_okay"])
 
+    def showEvent(self, event: QtGui.QShowEvent):
+        """
+        Handle the show event and load the svg logo on the first call.
+
+        Parameters
+        ----------
+        event : QtGui.QShowEvent
+            The calling event.
+        """
+        if not self._icon_loaded:
+            _placeholder = self._widgets["icon"]
+            _icon = logos.pydidas_error_svg()
+            _icon.setFixedSize(self._icon_size, self._icon_size)
+            _icon.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+            self.layout().replaceWidget(_placeholder, _icon)
+            _placeholder.deleteLater()
+            self._widgets["icon"] = _icon
+            self._icon_loaded = True
+        QtWidgets.QDialog.showEvent(self, event)
+
     def set_text(self, text: str):
         """
         Set the text in the message box.
@@ -141,25 +194,13 @@ class ErrorMessageBox(QtWidgets.QDialog, CreateWidgetsMixIn):
         text : str
             The text to be displayed.
         """
-        _logfile = os.path.join(get_logging_dir(), "pydidas_exception.log")
-        _note = (
-            "Please report the bug online using the form available on:\n"
-            "\thttps://pydidas.hereon.de/\n\n"
-            "You can simply use the button on the bottom left to coyy the\n"
-            "exception trace to your clipboard and open the webpage in your"
-            " default browser."
-            f"\n\nA log has been written to:\n\t{_logfile}\n\n"
-            + "-" * 20
-            + "\n"
-            + "Exception trace:\n\n"
-        )
+        _full_text = _NOTE_TEMPLATE.format(logfile=_get_logfile(), text=text)
         self._text = text
-        copy_text_to_system_clipbord(self._text)
-        self._widgets["label"].setText(_note + text)
-        _lines = (_note + text).split("\n")
-        _max_len = max(len(_line) for _line in _lines)
-        self._widgets["label"].font_metric_height_factor = len(_lines)
-        self._widgets["label"].font_metric_width_factor = _max_len + 5
+        _label = self._widgets["label"]
+        _label.setText(_full_text)
+        _lines = _full_text.split("\n")
+        _label.font_metric_height_factor = len(_lines)
+        _label.font_metric_width_factor = max(len(_line) for _line in _lines) + 5
 
     def copy_to_clipboard_and_open_webpage(self):
         """
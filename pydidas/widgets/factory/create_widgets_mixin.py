@@ -60,6 +60,39 @@ class CreateWidgetsMixIn:
         self._widgets = {}
         self.__index_unreferenced = 0
 
+    def __get_parent_widget(self, kwargs: dict) -> Union[QWidget, None]:
+        """
+        Pop the parent widget from the kwargs and resolve widget references.
+
+        Parameters
+        ----------
+        kwargs : dict
+            The widget creation kwargs. The "parent_widget" key is removed.
+
+        Returns
+        -------
+        Union[QWidget, None]
+            The parent widget. If no parent was given, this is the object
+            itself.
+        """
+        _parent = kwargs.pop("parent_widget", self)
+        if isinstance(_parent, str):
+            return self._widgets[_parent]
+        return _parent
+
+    def __get_unreferenced_key(self) -> str:
+        """
+        Get a new reference key for a widget without a reference.
+
+        Returns
+        -------
+        str
+            The new reference key.
+        """
+        _key = "unreferenced_" + str(self.__index_unreferenced).zfill(3)
+        self.__index_unreferenced += 1
+        return _key
+
     def create_spacer(self, ref: Union[str, None], **kwargs: Dict):
         """
         Create a QSpacerItem and set its properties.
@@ -74,23 +107,19 @@ class CreateWidgetsMixIn:
             are valid kwargs. In addition, the gridPos key allows to specify
             the spacer's position in its parent's layout.
         """
-        _parent = kwargs.get("parent_widget", self)
-        if isinstance(_parent, str):
-            _parent = self._widgets[_parent]
+        _parent = self.__get_parent_widget(kwargs)
 
-        _policy = kwargs.get("policy", QtWidgets.QSizePolicy.Minimum)
+        _policy = kwargs.pop("policy", QtWidgets.QSizePolicy.Minimum)
         _spacer = QtWidgets.QSpacerItem(
             kwargs.pop("fixedWidth", 20),
             kwargs.pop("fixedHeight", 20),
             _policy,
             kwargs.pop("vertical_policy", _policy),
         )
-        apply_qt_properties(self, **kwargs)
         _layout_args = get_widget_layout_args(_parent, **kwargs)
         _parent.layout().addItem(_spacer, *_layout_args)
         if ref is None:
-            ref = f"unreferenced_{self.__index_unreferenced:03d}"
-            self.__index_unreferenced += 1
+            ref = self.__get_unreferenced_key()
         self._widgets[ref] = _spacer
 
     def create_label(self, ref: Union[str, None], text: str, **kwargs: dict):
@@ -305,11 +334,11 @@ class CreateWidgetsMixIn:
         TypeError
             If the reference "ref" is not of type string.
         """
-        if hasattr(widget_class, "init_kwargs"):
-            _init_kwargs = {}
-            for _key in widget_class.init_kwargs:
-                if _key in kwargs:
-                    _init_kwargs[_key] = kwargs.pop(_key)
+        _init_keys = getattr(widget_class, "init_kwargs", None)
+        if _init_keys is not None and kwargs:
+            _init_kwargs = {
+                _key: kwargs.pop(_key) for _key in _init_keys if _key in kwargs
+            }
             _widget = widget_class(*args, **_init_kwargs)
         else:
             _widget = widget_class(*args)
@@ -334,10 +363,8 @@ class CreateWidgetsMixIn:
         """
         if not (isinstance(ref, str) or ref is None):
             raise TypeError("Widget reference must be None or a string.")
-        _parent = kwargs.pop("parent_widget", self)
+        _parent = self.__get_parent_widget(kwargs)
         _layout_kwargs = kwargs.pop("layout_kwargs", None)
-        if isinstance(_parent, str):
-            _parent = self._widgets[_parent]
 
         apply_qt_properties(widget_instance, **kwargs)
         if _layout_kwargs is not None:
@@ -346,6 +373,5 @@ class CreateWidgetsMixIn:
             _layout_args = get_widget_layout_args(_parent, **kwargs)
             _parent.layout().addWidget(widget_instance, *_layout_args)
         if ref is None:
-            ref = f"unreferenced_{self.__index_unreferenced:03d}"
-            self.__index_unreferenced += 1
+            ref = self.__get_unreferenced_key()
         self._widgets[ref] = widget_instance
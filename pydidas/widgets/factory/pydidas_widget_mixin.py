@@ -34,7 +34,7 @@ from qtpy import QtCore
 from qtpy.QtWidgets import QApplication
 
 from ...core.constants import GENERIC_STANDARD_WIDGET_WIDTH, MINIMUN_WIDGET_DIMENSIONS
-from ...core.utils import apply_qt_properties, update_qobject_font
+from ...core.utils import apply_qt_properties
 
 
 class PydidasWidgetMixin:
@@ -65,27 +65,28 @@ class PydidasWidgetMixin:
         **kwargs : dict
             Any kwargs for setting the font or other Qt parameters.
         """
-        self.__font_config = {
-            "bold": kwargs.get("bold", False),
-            "italic": kwargs.get("italic", False),
-            "size_offset": kwargs.get("fontsize_offset", 0),
-            "underline": kwargs.get("underline", False),
-        }
+        self.__fontsize_offset = kwargs.get("fontsize_offset", 0)
         self._size_hint = [
             kwargs.get("size_hint_width", GENERIC_STANDARD_WIDGET_WIDTH),
             25,
         ]
         apply_qt_properties(self, **kwargs)
         self._qtapp = QApplication.instance()
-        self.update_fontsize(self._qtapp.font_size)
-        self.update_font_family(self._qtapp.font_family)
+        _font = self.font()
+        _font.setPointSizeF(self._qtapp.font_size + self.__fontsize_offset)
+        _font.setFamily(self._qtapp.font_family)
+        _bold = kwargs.get("bold", False)
+        _italic = kwargs.get("italic", False)
+        _underline = kwargs.get("underline", False)
+        if _bold or _italic or _underline:
+            _font.setBold(_bold)
+            _font.setItalic(_italic)
+            _font.setUnderline(_underline)
+        self.setFont(_font)
         self._minimum_width = kwargs.get("minimum_width", MINIMUN_WIDGET_DIMENSIONS)
-        if True in self.__font_config.values():
-            update_qobject_font(self, **self.__font_config)
         self._font_metric_width_factor = kwargs.get("font_metric_width_factor", None)
         self._font_metric_height_factor = kwargs.get("font_metric_height_factor", None)
-        self._qtapp.sig_new_fontsize.connect(self.update_fontsize)
-        self._qtapp.sig_new_font_family.connect(self.update_font_family)
+        self._qtapp.sig_new_font_config.connect(self.update_font)
         self._qtapp.sig_new_font_metrics.connect(self.process_new_font_metrics)
         self.process_new_font_metrics(*self._qtapp.font_metrics)
 
@@ -100,6 +101,26 @@ class PydidasWidgetMixin:
         """
         return QtCore.QSize(*self._size_hint)
 
+    @QtCore.Slot(float, str)
+    def update_font(self, new_fontsize: float, new_family: str):
+        """
+        Update the fontsize and font family with the new global defaults.
+
+        Parameters
+        ----------
+        new_fontsize : float
+            The new font size.
+        new_family : str
+            The name of the new font family.
+        """
+        _font = self.font()
+        _new_size = new_fontsize + self.__fontsize_offset
+        if _font.pointSizeF() == _new_size and _font.family() == new_family:
+            return
+        _font.setPointSizeF(_new_size)
+        _font.setFamily(new_family)
+        self.setFont(_font)
+
     @QtCore.Slot(float)
     def update_fontsize(self, new_fontsize: float):
         """
@@ -111,7 +132,10 @@ class PydidasWidgetMixin:
             The new font size.
         """
         _font = self.font()
-        _font.setPointSizeF(new_fontsize + self.__font_config["size_offset"])
+        _new_size = new_fontsize + self.__fontsize_offset
+        if _font.pointSizeF() == _new_size:
+            return
+        _font.setPointSizeF(_new_size)
         self.setFont(_font)
 
     @QtCore.Slot(str)
@@ -125,6 +149,8 @@ class PydidasWidgetMixin:
             The name of the new font family.
         """
         _font = self.font()
+        if _font.family() == new_family:
+            return
         _font.setFamily(new_family)
         self.setFont(_font)
 
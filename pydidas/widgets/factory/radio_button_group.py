@@ -71,7 +71,6 @@ class RadioButtonGroup(QtWidgets.QWidget):
         self._active_index = 0
         self._emit_signal = True
         self._buttons = {}
-        self._button_indices = {}
         self._button_label = {}
         if entries is not None:
             self.__create_widgets(entries)
@@ -106,10 +105,9 @@ class RadioButtonGroup(QtWidgets.QWidget):
             _curry = _index // self._columns
             _button = QtWidgets.QRadioButton(_entry, self)
             _button.toggled.connect(self.__toggled)
-            self._button_indices[id(_button)] = _index
             self._button_label[_entry] = _index
             self._buttons[_index] = _button
-            self.q_button_group.addButton(_button)
+            self.q_button_group.addButton(_button, _index)
             _layout.addWidget(
                 _button, _yoffset + _curry, _currx, 1, 1, QtCore.Qt.AlignTop
             )
@@ -138,11 +136,9 @@ class RadioButtonGroup(QtWidgets.QWidget):
         value : bool
             The new value.
         """
-        if value is True:
-            self._emit_signal = True
-        elif value is False:
-            self._emit_signal = False
-        raise ValueError("The new value must be boolean.")
+        if not isinstance(value, bool):
+            raise ValueError("The new value must be boolean.")
+        self._emit_signal = value
 
     @QtCore.Slot()
     def __toggled(self):
@@ -154,7 +150,7 @@ class RadioButtonGroup(QtWidgets.QWidget):
         """
         _button = self.sender()
         if _button.isChecked():
-            _index = self._button_indices[id(_button)]
+            _index = self.q_button_group.id(_button)
             _entry = _button.text()
             self._active_index = _index
             self._active_label = _entry
@@ -45,6 +45,7 @@ class SquareButton(PydidasWidgetMixin, QtWidgets.QPushButton):
         if isinstance(kwargs.get("icon"), str):
             kwargs["icon"] = get_pyqt_icon_from_str(kwargs.get("icon"))
         QtWidgets.QPushButton.__init__(self, *args)
+        self.__size = None
         PydidasWidgetMixin.__init__(self, **kwargs)
         self.__update_min_sizes(self._qtapp.font_height)
 
@@ -88,9 +89,11 @@ class SquareButton(PydidasWidgetMixin, QtWidgets.QPushButton):
         font_height : float
             The font height metrics.
         """
-        self.__size = int(max(font_height + 6, MINIMUN_WIDGET_DIMENSIONS))
-        self.setMinimumWidth(self.__size)
-        self.setMinimumHeight(self.__size)
+        _size = int(max(font_height + 6, MINIMUN_WIDGET_DIMENSIONS))
+        if _size == self.__size:
+            return
+        self.__size = _size
+        self.setMinimumSize(_size, _size)
 
     def sizeHint(self):
         """
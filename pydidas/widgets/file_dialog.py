@@ -110,6 +110,7 @@ class PydidasFileDialogWidget(
         """Set the basic configuration for the widget."""
         self.setViewMode(QtWidgets.QFileDialog.Detail)
         self.setOption(QtWidgets.QFileDialog.DontUseNativeDialog)
+        self.setOption(QtWidgets.QFileDialog.DontUseCustomDirectoryIcons)
         self.setSidebarUrls(
             [
                 QtCore.QUrl("file:"),
@@ -34,6 +34,12 @@ from ...core import SingletonFactory
 from ...core.utils import get_time_string
 
 
+# The delay in milliseconds for collecting status messages before displaying them:
+STATUS_UPDATE_DELAY = 30
+# The maximum number of lines kept in the status widget:
+STATUS_MAX_LINES = 2000
+
+
 class _PydidasStatusWidget(QtWidgets.QPlainTextEdit):
     """
     The PydidasStatusWidget is a subclassed QPlainTextEdit with an additional method
@@ -43,8 +49,14 @@ class _PydidasStatusWidget(QtWidgets.QPlainTextEdit):
     def __init__(self, **kwargs: dict):
         QtWidgets.QPlainTextEdit.__init__(self, kwargs.get("parent", None))
         self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
         self.setMinimumHeight(50)
         self.resize(500, 50)
+        self.__pending_messages = []
+        self.__update_timer = QtCore.QTimer(self)
+        self.__update_timer.setSingleShot(True)
+        self.__update_timer.setInterval(STATUS_UPDATE_DELAY)
+        self.__update_timer.timeout.connect(self.__display_pending_messages)
         QtWidgets.QApplication.instance().sig_status_message.connect(self.add_status)
 
     def sizeHint(self) -> QtCore.QSize:
@@ -64,20 +76,66 @@ class _PydidasStatusWidget(QtWidgets.QPlainTextEdit):
         Add a status message to the PydidasStatusWidget.
 
         This method will add a status message to the Info/Log widget together
-        with a timestamp.
+        with a timestamp. While the widget is visible, messages are collected
+        for a short time and then displayed together to avoid repainting the
+        widget for every message. Messages for a hidden widget are displayed
+        immediately. Use the flush method to display pending messages right
+        away.
 
         Parameters
         ----------
         text : str
             The text to add.
         """
-        if text[-1] != "\n":
+        if not text.endswith("\n"):
             text = text + "\n"
-        _cursor = self.textCursor()
-        _cursor.movePosition(QtGui.QTextCursor.Start, QtGui.QTextCursor.MoveAnchor, 1)
-        self.setTextCursor(_cursor)
-        self.insertPlainText(f"{get_time_string()}: {text}")
+        self.__pending_messages.append(f"{get_time_string()}: {text}")
+        if not self.isVisible():
+            self.flush()
+        elif not self.__update_timer.isActive():
+            self.__update_timer.start()
+
+    @QtCore.Slot()
+    def flush(self):
+        """
+        Display all pending status messages immediately.
+        """
+        self.__update_timer.stop()
+        self.__display_pending_messages()
+
+    @QtCore.Slot()
+    def __display_pending_messages(self):
+        """
+        Display all pending status messages, with the newest message on top.
+
+        The oldest messages are removed if the number of lines exceeds
+        STATUS_MAX_LINES.
+        """
+        if len(self.__pending_messages) == 0:
+            return
+        _text = "".join(reversed(self.__pending_messages))
+        self.__pending_messages.clear()
+        _cursor = QtGui.QTextCursor(self.document())
+        _cursor.insertText(_text)
+        if self.document().blockCount() > STATUS_MAX_LINES:
+            _cursor.setPosition(
+                self.document().findBlockByNumber(STATUS_MAX_LINES).position()
+            )
+            _cursor.movePosition(QtGui.QTextCursor.End, QtGui.QTextCursor.KeepAnchor)
+            _cursor.removeSelectedText()
         self.verticalScrollBar().triggerAction(QtWidgets.QScrollBar.SliderToMinimum)
 
+    def hideEvent(self, event: QtGui.QHideEvent):
+        """
+        Display all pending messages before hiding the widget.
+
+        Parameters
+        ----------
+        event : QtGui.QHideEvent
+            The hide event.
+        """
+        self.flush()
+        QtWidgets.QPlainTextEdit.hideEvent(self, event)
+
 
 PydidasStatusWidget = SingletonFactory(_PydidasStatusWidget)
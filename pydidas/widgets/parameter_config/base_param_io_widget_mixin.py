@@ -49,6 +49,14 @@ FLOAT_VALIDATOR = QtGui.QDoubleValidator()
 FLOAT_VALIDATOR.setNotation(QtGui.QDoubleValidator.ScientificNotation)
 FLOAT_VALIDATOR.setLocale(LOCAL_SETTINGS)
 
+_TEXT_CONVERTERS = {
+    numbers.Integral: int,
+    numbers.Real: float,
+    pathlib.Path: pathlib.Path,
+    Hdf5key: Hdf5key,
+}
+_SPECIAL_TEXT_VALUES = {"TRUE": True, "FALSE": False, "NAN": nan, "NONE": None}
+
 
 class BaseParamIoWidgetMixIn:
     """
@@ -66,6 +74,7 @@ class BaseParamIoWidgetMixIn:
 
     def __init__(self, param: Parameter, **kwargs: dict):
         self._ptype = param.dtype
+        self._text_converter = _TEXT_CONVERTERS.get(param.dtype, None)
         self._allow_None = param.allow_None
         self._old_value = None
         self.__hint_factor = 1 + int(kwargs.get("linebreak", False))
@@ -118,34 +127,23 @@ class BaseParamIoWidgetMixIn:
         """
         # need to process True and False explicitly because bool is a subtype
         # of int but the strings 'True' and 'False' cannot be converted to int
-        if text.upper() == "TRUE":
-            return True
-        if text.upper() == "FALSE":
-            return False
-        if text.upper() == "NAN":
-            return nan
-        if text.upper() == "NONE":
+        _upper_text = text.upper()
+        if _upper_text in _SPECIAL_TEXT_VALUES:
+            return _SPECIAL_TEXT_VALUES[_upper_text]
+        if self._text_converter is None:
+            return text
+        if (
+            text == ""
+            and self._allow_None
+            and self._ptype in (numbers.Integral, numbers.Real)
+        ):
             return None
         try:
-            if (
-                text == ""
-                and self._allow_None
-                and self._ptype in [numbers.Integral, numbers.Real]
-            ):
-                return None
-            if self._ptype == numbers.Integral:
-                return int(text)
-            if self._ptype == numbers.Real:
-                return float(text)
-            if self._ptype == pathlib.Path:
-                return pathlib.Path(text)
-            if self._ptype == Hdf5key:
-                return Hdf5key(text)
+            return self._text_converter(text)
         except ValueError as _error:
             _msg = str(_error)
             _msg = _msg[0].upper() + _msg[1:]
             raise UserConfigError(f'ValueError! {_msg} Input text was "{text}"')
-        return text
 
     def emit_signal(self):
         """
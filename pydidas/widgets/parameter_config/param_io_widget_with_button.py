@@ -28,7 +28,7 @@ __status__ = "Production"
 __all__ = ["ParamIoWidgetWithButton"]
 
 
-from functools import partial
+from functools import cache, partial
 
 from qtpy import QtCore, QtGui, QtWidgets
 from qtpy.QtWidgets import QStyle
@@ -38,6 +38,22 @@ from ..factory import PydidasLineEdit, SquareButton
 from .base_param_io_widget_mixin import BaseParamIoWidgetMixIn
 
 
+@cache
+def _get_default_button_icon() -> QtGui.QIcon:
+    """
+    Get the default icon for the button.
+
+    The icon is created only once and shared by all widgets.
+
+    Returns
+    -------
+    QtGui.QIcon
+        The standard icon of the application style for opening a file.
+    """
+    _style = QtWidgets.QApplication.instance().style()
+    return _style.standardIcon(QStyle.SP_DialogOpenButton)
+
+
 class ParamIoWidgetWithButton(BaseParamIoWidgetMixIn, QtWidgets.QWidget):
     """
     Widgets for Parameter I/O which includes a freely programmable button.
@@ -59,9 +75,7 @@ class ParamIoWidgetWithButton(BaseParamIoWidgetMixIn, QtWidgets.QWidget):
         BaseParamIoWidgetMixIn.__init__(self, param, **kwargs)
         self._io_lineedit = PydidasLineEdit()
         if not isinstance(kwargs.get("button_icon", None), QtGui.QIcon):
-            kwargs["button_icon"] = self.style().standardIcon(
-                QStyle.SP_DialogOpenButton
-            )
+            kwargs["button_icon"] = _get_default_button_icon()
         self._button = SquareButton(
             kwargs["button_icon"], "", font_metric_height_factor=1
         )
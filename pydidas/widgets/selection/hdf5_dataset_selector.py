@@ -28,8 +28,8 @@ __status__ = "Production"
 __all__ = ["Hdf5DatasetSelector"]
 
 
-from functools import partial
 from pathlib import Path
+from typing import Union
 
 import h5py
 from qtpy import QtCore, QtWidgets
@@ -51,6 +51,11 @@ DEFAULT_FILTERS = {
     "/entry/instrument/detector/detectorSpecific/": '"detectorSpecific"\nkeys (Eiger detector)'
 }
 
+# The delay in milliseconds before processing a changed frame index:
+INDEX_UPDATE_DELAY = 50
+# The delay in milliseconds before processing changed dataset filter values:
+FILTER_UPDATE_DELAY = 200
+
 
 class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
     """
@@ -88,10 +93,11 @@ class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
         apply_qt_properties(self, **kwargs)
 
         self._config = {
-            "activeDsetFilters": [],
+            "activeDsetFilters": (),
             "currentDset": None,
             "current_filename": None,
             "currentIndex": None,
+            "currentNdim": None,
             "dsetFilters": (
                 dataset_key_filters
                 if dataset_key_filters is not None
@@ -103,6 +109,15 @@ class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
         if plot_widget is not None:
             self.register_plot_widget(plot_widget)
         self._frame = None
+        self._filter_checkboxes = {}
+        self.__index_update_timer = QtCore.QTimer(self)
+        self.__index_update_timer.setSingleShot(True)
+        self.__index_update_timer.setInterval(INDEX_UPDATE_DELAY)
+        self.__index_update_timer.timeout.connect(self.__process_index_update)
+        self.__filter_update_timer = QtCore.QTimer(self)
+        self.__filter_update_timer.setSingleShot(True)
+        self.__filter_update_timer.setInterval(FILTER_UPDATE_DELAY)
+        self.__filter_update_timer.timeout.connect(self.__populate_dataset_list)
         self.__create_widgets_and_layout()
         self.__connect_slots()
 
@@ -118,18 +133,17 @@ class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
         self.setLayout(_layout)
 
         # create checkboxes and links for all filter keys:
-        _w_filter_keys = []
         for key, text in self._config["dsetFilters"].items():
             _widget = QtWidgets.QCheckBox(f"Ignore {text}")
             _widget.setChecked(False)
-            _widget.stateChanged.connect(partial(self._toggle_filter_key, _widget, key))
-            _w_filter_keys.append(_widget)
-        for i, widget in enumerate(_w_filter_keys):
-            _layout.addWidget(widget, i // 2, i % 2, 1, 2)
+            _widget.stateChanged.connect(self._update_active_filter_keys)
+            self._filter_checkboxes[key] = _widget
+        for i, widget in enumerate(self._filter_checkboxes.values()):
+            _layout.addWidget(widget, *divmod(i, 2), 1, 2)
 
         # Determine the layout row offset for the other widgets based on
         # the number of filter key checkboxes:
-        _row_offset = len(_w_filter_keys) // 2 + len(_w_filter_keys) % 2
+        _row_offset = (len(self._filter_checkboxes) + 1) // 2
 
         self.create_label(None, "Min. dataset\nsize: ", gridPos=(_row_offset, 0, 1, 1))
         self.create_label(
@@ -183,8 +197,8 @@ class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
 
         Filter keys are set up dynamically along with their checkbox widgets.
         """
-        self._widgets["min_datasize"].valueChanged.connect(self.__populate_dataset_list)
-        self._widgets["min_datadim"].valueChanged.connect(self.__populate_dataset_list)
+        self._widgets["min_datasize"].valueChanged.connect(self.__filter_values_changed)
+        self._widgets["min_datadim"].valueChanged.connect(self.__filter_values_changed)
         self._widgets["select_dataset"].currentTextChanged.connect(
             self.__select_dataset
         )
@@ -192,6 +206,17 @@ class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
         self._widgets["but_view"].clicked.connect(self.click_view_button)
         self._widgets["auto_update"].clicked.connect(self._toggle_auto_update)
 
+    @QtCore.Slot()
+    def __filter_values_changed(self):
+        """
+        Schedule an update of the dataset list after changed filter values.
+
+        The update is delayed by FILTER_UPDATE_DELAY milliseconds to collect
+        consecutive changes, e.g. while typing a number, and to read the file
+        structure only once.
+        """
+        self.__filter_update_timer.start()
+
     def __populate_dataset_list(self):
         """
         Populate the dateset selection with a filtered list of datasets.
@@ -200,6 +225,7 @@ class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
         list of datasets according to the selected criteria. The filtered list
         is used to populate the selection drop-down menu.
         """
+        self.__filter_update_timer.stop()
         _dset_filter_min_size = self._widgets["min_datasize"].value()
         _dset_filter_min_dim = self._widgets["min_datadim"].value()
         _datasets = get_hdf5_populated_dataset_keys(
@@ -209,12 +235,15 @@ class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
             ignore_keys=self._config["activeDsetFilters"],
         )
         _combo = self._widgets["select_dataset"]
-        with QtCore.QSignalBlocker(self._widgets["select_dataset"]):
-            self._widgets["select_dataset"].clear()
-            self._widgets["select_dataset"].addItems(_datasets)
+        _combo.setUpdatesEnabled(False)
+        with QtCore.QSignalBlocker(_combo):
+            _combo.clear()
+            _combo.addItems(_datasets)
+        _combo.setUpdatesEnabled(True)
         if len(_datasets) > 0:
-            _items = [_combo.itemText(i) for i in range(_combo.count())]
-            _combo.view().setMinimumWidth(get_max_pixel_width_of_entries(_items) + 50)
+            _combo.view().setMinimumWidth(
+                get_max_pixel_width_of_entries(_datasets) + 50
+            )
             self.__select_dataset()
         else:
             self._widgets["but_view"].setEnabled(False)
@@ -228,80 +257,97 @@ class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
         a different dataset to be visualized. This method also updates the
         accepted frame range for the sliders.
         """
-        _dset = self._widgets["select_dataset"].currentText()
+        _dset_key = self._widgets["select_dataset"].currentText()
         with h5py.File(self._config["current_filename"], "r") as _file:
-            _shape = _file[_dset].shape
-        n_frames = _shape[0] if len(_shape) >= 3 else 1
-        self._widgets["frame_browser"].setRange(0, n_frames - 1)
-        self._config["currentIndex"] = 0
-        self._widgets["but_view"].setEnabled(True)
-        self.__update()
-
-    def __update(self, new_frame: bool = False):
+            _dset = _file[_dset_key]
+            _shape = _dset.shape
+            self._config["currentNdim"] = len(_shape)
+            n_frames = _shape[0] if len(_shape) >= 3 else 1
+            self._widgets["frame_browser"].setRange(0, n_frames - 1)
+            self._config["currentIndex"] = 0
+            self._widgets["but_view"].setEnabled(True)
+            self.__update(dataset=_dset)
+
+    def __update(
+        self, new_frame: bool = False, dataset: Union[h5py.Dataset, None] = None
+    ):
         """
         Propagate an update to any consumers.
 
         This method will read a new frame from the file if any consumers
         demand it (consumers must activate the signal slot or the automatic
-        update). The new frame will be passed to any active view/preview
-        widgets and a signal emitted if the slot is active.
+        update with a registered plot widget). The new frame will be passed
+        to any active view/preview widgets and a signal emitted if the slot
+        is active. Without any consumers, no frame is read and the stored
+        frame is reset.
 
         Parameters
         ----------
         new_frame : bool
             A flag to tell this method to process a new frame, e.g. after changing
             the dataset.
+        dataset : Union[h5py.Dataset, None], optional
+            An already opened dataset to read the frame from. If None, the
+            dataset will be read from the file. The default is None.
         """
-        if self.flags["autoUpdate"] or self.flags["slotActive"] or new_frame:
-            self.__get_frame()
-            if self._frame is None:
-                return
+        _show_frame = (
+            self.flags["autoUpdate"] and self._widgets.get("plot", None) is not None
+        )
+        if not (_show_frame or self.flags["slotActive"] or new_frame):
+            self._frame = None
+            return
+        self.__get_frame(dataset)
+        if self._frame is None:
+            return
         if self.flags["slotActive"]:
             self.new_frame_signal.emit(self._frame)
-        if self.flags["autoUpdate"] and self._widgets["plot"] is not None:
+        if _show_frame:
             self.show_image_method(self._frame, legend="pydidas image")
 
-    def __get_frame(self):
+    def __get_frame(self, dataset: Union[h5py.Dataset, None] = None):
         """
         Get and store a frame.
 
         This internal method reads an image frame from the hdf5 dataset and
         stores it internally for further processing (passing to other widgets
         / signals)
+
+        Parameters
+        ----------
+        dataset : Union[h5py.Dataset, None], optional
+            An already opened dataset to read the frame from. If None, the
+            selected dataset will be opened from the file. The default is None.
         """
-        _dset = self._widgets["select_dataset"].currentText()
-        if _dset == "":
-            self._frame = None
-        with h5py.File(self._config["current_filename"], "r") as _file:
-            _dset = _file[_dset]
-            _ndim = len(_dset.shape)
-            if _ndim >= 3:
-                self._frame = _dset[self._config["currentIndex"]]
-            elif _ndim == 2:
-                self._frame = _dset[...]
-
-    def _toggle_filter_key(self, widget: QtWidgets.QWidget, key: str):
+        if dataset is None:
+            _dset_key = self._widgets["select_dataset"].currentText()
+            if _dset_key == "" or self._config["currentNdim"] is None:
+                self._frame = None
+                return
+            with h5py.File(self._config["current_filename"], "r") as _file:
+                self.__get_frame(_file[_dset_key])
+            return
+        _ndim = self._config["currentNdim"]
+        if _ndim >= 3:
+            self._frame = dataset[self._config["currentIndex"]]
+        elif _ndim == 2:
+            self._frame = dataset[...]
+
+    @QtCore.Slot()
+    def _update_active_filter_keys(self):
         """
-        Add or remove the filter key from the active dataset key filters.
+        Update the active dataset key filters from the filter checkboxes.
 
-        This method will add or remove the <key> which is associated with the
-        checkbox widget <widget> from the active dataset filters.
+        The active filters are collected from the current states of all filter
+        checkboxes and the dataset list is updated.
         Note: This method should never be called by the user, but it is
         connected to the checkboxes which activate or deactivate the respective
         filters.
-
-        Parameters
-        ----------
-        widget : QWidget
-            The checkbox widget which is associated with enabling/disabling
-            the filter key.
-        key : str
-            The dataset filter string.
         """
-        if widget.isChecked() and key not in self._config["activeDsetFilters"]:
-            self._config["activeDsetFilters"].append(key)
-        if not widget.isChecked() and key in self._config["activeDsetFilters"]:
-            self._config["activeDsetFilters"].remove(key)
+        self._config["activeDsetFilters"] = tuple(
+            _key
+            for _key, _widget in self._filter_checkboxes.items()
+            if _widget.isChecked()
+        )
         self.__populate_dataset_list()
 
     def _toggle_auto_update(self):
@@ -352,7 +398,9 @@ class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
         Store the new index from the frame selector.
 
         This method is connected to the frame selector (slider/field) and
-        calls for an update of the frame if the index has changed.
+        schedules an update of the frame if the index has changed. The update
+        is delayed by INDEX_UPDATE_DELAY milliseconds to skip intermediate
+        frames while dragging the slider.
 
         Parameters
         ----------
@@ -360,6 +408,16 @@ class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
             The index in the image dataset.
         """
         self._config["currentIndex"] = index
+        self.__index_update_timer.start()
+
+    @QtCore.Slot()
+    def __process_index_update(self):
+        """
+        Process the last index change from the frame selector.
+
+        Index changes are collected by a single-shot timer to skip reading
+        intermediate frames while the user drags the slider.
+        """
         self.__update(True)
 
     def click_view_button(self):
@@ -368,6 +426,9 @@ class Hdf5DatasetSelector(QtWidgets.QWidget, CreateWidgetsMixIn):
 
         This method is connected to the clicked event of the View button.
         """
+        if self.__index_update_timer.isActive():
+            self.__index_update_timer.stop()
+            self.__update(True)
         if self._frame is None or not self.flags["autoUpdate"]:
             self.__get_frame()
         if not isinstance(self._widgets["plot"], QtWidgets.QWidget):
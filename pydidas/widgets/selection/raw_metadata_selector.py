@@ -41,6 +41,50 @@ from ..widget_with_parameter_collection import WidgetWithParameterCollection
 from .common_selection import register_plot_widget_method
 
 
+class _RawDecodeSignals(QtCore.QObject):
+    """
+    The signals of the _RawDecodeRunnable.
+
+    The signal carries the read ID, the decoded data and the raised exception.
+    Either the data or the exception is None.
+    """
+
+    sig_finished = QtCore.Signal(int, object, object)
+
+
+class _RawDecodeRunnable(QtCore.QRunnable):
+    """
+    A QRunnable to read a raw file in a background thread.
+
+    Parameters
+    ----------
+    read_id : int
+        The ID of the read to identify the results.
+    filename : Path
+        The filename of the raw file.
+    **kwargs : dict
+        The keyword arguments for the import_data function.
+    """
+
+    def __init__(self, read_id: int, filename: Path, **kwargs: dict):
+        QtCore.QRunnable.__init__(self)
+        self.signals = _RawDecodeSignals()
+        self._read_id = read_id
+        self._filename = filename
+        self._kwargs = kwargs
+
+    def run(self):
+        """
+        Read the file and emit the data or the raised exception.
+        """
+        try:
+            _data = import_data(self._filename, **self._kwargs)
+        except Exception as _error:
+            self.signals.sig_finished.emit(self._read_id, None, _error)
+            return
+        self.signals.sig_finished.emit(self._read_id, _data, None)
+
+
 class RawMetadataSelector(WidgetWithParameterCollection):
     """
     A compound widget to select metadata in raw image files.
@@ -65,7 +109,9 @@ class RawMetadataSelector(WidgetWithParameterCollection):
     def __init__(self, **kwargs: dict):
         WidgetWithParameterCollection.__init__(self, **kwargs)
         self.add_params(self.default_params.copy())
-        self._config = {"filename": None}
+        self._config = {"filename": None, "read_id": 0}
+        self._thread_pool = QtCore.QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
         self.show_image_method = None
         self._widgets["plot"] = kwargs.get("plot_widget", None)
         if self._widgets["plot"] is not None:
@@ -124,6 +170,11 @@ class RawMetadataSelector(WidgetWithParameterCollection):
     def _decode_file(self):
         """
         Confirm the params and send them to the calling frame.
+
+        The file is read in a background thread to keep the GUI responsive and
+        the data is displayed once it is available. The confirm button is
+        disabled until the latest read has finished. Results of earlier reads
+        are discarded.
         """
         if not isinstance(self._widgets["plot"], QtWidgets.QWidget):
             raise PydidasGuiError("No plot widget has been registered.")
@@ -133,7 +184,39 @@ class RawMetadataSelector(WidgetWithParameterCollection):
             self.get_param_value("raw_shape_y"),
             self.get_param_value("raw_shape_x"),
         )
-        _data = import_data(
-            self._config["filename"], datatype=_datatype, offset=_offset, shape=_shape
+        self._widgets["confirm"].setEnabled(False)
+        self._config["read_id"] += 1
+        _runnable = _RawDecodeRunnable(
+            self._config["read_id"],
+            self._config["filename"],
+            datatype=_datatype,
+            offset=_offset,
+            shape=_shape,
         )
-        self.show_image_method(_data, legend="pydidas image")
+        _runnable.signals.sig_finished.connect(self.__display_decoded_data)
+        self._thread_pool.start(_runnable)
+
+    @QtCore.Slot(int, object, object)
+    def __display_decoded_data(self, read_id: int, data: object, error: object):
+        """
+        Display the decoded data.
+
+        This slot is called in the GUI thread once a background read has
+        finished. Results of superseded reads are ignored. Any exception
+        raised while reading the file is re-raised here.
+
+        Parameters
+        ----------
+        read_id : int
+            The ID of the finished read.
+        data : Union[np.ndarray, None]
+            The decoded data or None if the read failed.
+        error : Union[Exception, None]
+            The exception raised while reading the file or None.
+        """
+        if read_id != self._config["read_id"]:
+            return
+        self._widgets["confirm"].setEnabled(True)
+        if error is not None:
+            raise error
+        self.show_image_method(data, legend="pydidas image")
@@ -65,6 +65,7 @@ class PyFAI2dIntegration(pyFAIintegrationBase):
         """
         pyFAIintegrationBase.pre_execute(self)
         self._ai_params = {
+            "npt_rad": self.get_param_value("rad_npoint"),
             "npt_azim": self.get_param_value("azi_npoint"),
             "polarization_factor": self.get_param_value("polarization_factor"),
             "correctSolidAngle": self.get_param_value("correct_solid_angle"),
@@ -105,9 +106,7 @@ class PyFAI2dIntegration(pyFAIintegrationBase):
             Any calling kwargs, appended by any changes in the function.
         """
         self.check_and_set_custom_mask(**kwargs)
-        _newdata = self._ai.integrate2d(
-            data, self.get_param_value("rad_npoint"), **self._ai_params
-        )
+        _newdata = self._ai.integrate2d(data, **self._ai_params)
         _dataset = Dataset(
             _newdata[0],
             axis_ranges=[_newdata[2] * self.__range_factor, _newdata[1]],
@@ -29,9 +29,7 @@ __all__ = ["PyFAIazimuthalSectorIntegration"]
 
 
 import numpy as np
-from pyFAI.azimuthalIntegrator import AzimuthalIntegrator
 
-from pydidas.contexts import DiffractionExperimentContext
 from pydidas.core import (
     Dataset,
     Parameter,
@@ -41,8 +39,6 @@ from pydidas.core import (
 from pydidas.plugins import pyFAIintegrationBase
 
 
-EXP = DiffractionExperimentContext()
-
 SECTOR_CENTER_PARAM = Parameter(
     "azi_sector_centers",
     str,
@@ -103,27 +99,13 @@ class PyFAIazimuthalSectorIntegration(pyFAIintegrationBase):
         Pre-execute the plugin and store the Parameters required for the execution.
         """
         self._eval_sectors()
-        if self._exp_hash != hash(EXP):
-            _lambda_in_A = EXP.get_param_value("xray_wavelength")
-            self._ais = [
-                AzimuthalIntegrator(
-                    dist=EXP.get_param_value("detector_dist"),
-                    poni1=EXP.get_param_value("detector_poni1"),
-                    poni2=EXP.get_param_value("detector_poni2"),
-                    rot1=EXP.get_param_value("detector_rot1"),
-                    rot2=EXP.get_param_value("detector_rot2"),
-                    rot3=EXP.get_param_value("detector_rot3"),
-                    detector=EXP.get_detector(),
-                    wavelength=1e-10 * _lambda_in_A,
-                )
-                for _, _ in enumerate(self._config["sector_centers"])
-            ]
         self.load_and_set_mask()
-        if self._mask is not None:
-            for _ai in self._ais:
-                _ai.set_mask(self._mask)
+        self._ais = [
+            self._create_integrator() for _ in self._config["sector_centers"]
+        ]
         self._prepare_pyfai_method()
         self._ai_params = {
+            "npt": self.get_param_value("rad_npoint"),
             "unit": self.get_pyFAI_unit_from_param("rad_unit"),
             "radial_range": self.get_radial_range(),
             "polarization_factor": self.get_param_value("polarization_factor"),
@@ -175,13 +157,8 @@ class PyFAIazimuthalSectorIntegration(pyFAIintegrationBase):
         """
         self.check_and_set_custom_mask(**kwargs)
         _results = [
-            _ai.integrate1d(
-                data,
-                self.get_param_value("rad_npoint"),
-                azimuth_range=self._config["sector_ranges"][_index],
-                **self._ai_params,
-            )
-            for _index, _ai in enumerate(self._ais)
+            _ai.integrate1d(data, azimuth_range=_range, **self._ai_params)
+            for _ai, _range in zip(self._ais, self._config["sector_ranges"])
         ]
         _newdata = np.asarray([_res[1] for _res in _results])
         _axranges = [self._config["sector_centers"], _results[0][0]]
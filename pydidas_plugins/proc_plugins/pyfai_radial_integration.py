@@ -56,6 +56,7 @@ class PyFAIradialIntegration(pyFAIintegrationBase):
         """
         pyFAIintegrationBase.pre_execute(self)
         self._ai_params = {
+            "npt": self.get_param_value("azi_npoint"),
             "npt_rad": self.get_param_value("rad_npoint"),
             "polarization_factor": self.get_param_value("polarization_factor"),
             "correctSolidAngle": self.get_param_value("correct_solid_angle"),
@@ -92,9 +93,7 @@ class PyFAIradialIntegration(pyFAIintegrationBase):
             Any calling kwargs, appended by any changes in the function.
         """
         self.check_and_set_custom_mask(**kwargs)
-        _newdata = self._ai.integrate_radial(
-            data, self.get_param_value("azi_npoint"), **self._ai_params
-        )
+        _newdata = self._ai.integrate_radial(data, **self._ai_params)
         _dataset = Dataset(_newdata[1], axis_ranges=[_newdata[0]], **self._dataset_info)
         return _dataset, kwargs
 
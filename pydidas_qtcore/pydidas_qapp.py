@@ -113,6 +113,7 @@ class PydidasQApplication(QApplication):
     sig_font_size_changed = QtCore.Signal()
     sig_new_font_family = QtCore.Signal(str)
     sig_font_family_changed = QtCore.Signal()
+    sig_new_font_config = QtCore.Signal(float, str)
     sig_new_font_metrics = QtCore.Signal(float, float)
     sig_font_metrics_changed = QtCore.Signal()
     sig_mpl_font_change = QtCore.Signal()
@@ -225,9 +226,22 @@ class PydidasQApplication(QApplication):
         self._update_font_metrics()
         mpl.rc("font", size=self.__font_config["size"])
         self.sig_new_fontsize.emit(self.__font_config["size"])
+        self.sig_new_font_config.emit(*self.font_config)
         self.sig_font_size_changed.emit()
         self.sig_mpl_font_change.emit()
 
+    @property
+    def font_config(self) -> Tuple[float, str]:
+        """
+        Get the standard font size and family.
+
+        Returns
+        -------
+        Tuple[float, str]
+            The font size and the font family.
+        """
+        return self.__font_config["size"], self.__font_config["family"]
+
     @property
     def font_height(self) -> int:
         """
@@ -272,6 +286,7 @@ class PydidasQApplication(QApplication):
         self._update_matplotlib_font_family()
         self._update_font_metrics()
         self.sig_new_font_family.emit(font_family)
+        self.sig_new_font_config.emit(*self.font_config)
         self.sig_font_family_changed.emit()
         self.sig_font_size_changed.emit()
 
@@ -292,6 +307,11 @@ class PydidasQApplication(QApplication):
                 "font/point_size", float(self.__font_config["size"])
             )
             self.sig_new_fontsize.emit(self.__font_config["size"])
+        if (
+            self.__font_config["family"] != _current_family
+            or self.__font_config["size"] != _current_size
+        ):
+            self.sig_new_font_config.emit(*self.font_config)
         self._update_font_metrics()
         self._update_matplotlib_font_family()
 
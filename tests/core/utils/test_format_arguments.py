@@ -38,6 +38,10 @@ class Test_format_arguments(unittest.TestCase):
         _args = format_arguments("--test", " a = 1", "b=2")
         self.assertEqual(_args, ["--test", "-a", "1", "-b", "2"])
 
+    def test_format_arguments__repeated_separators(self):
+        _args = format_arguments("  a ==  1 ", "-b= 2=")
+        self.assertEqual(_args, ["-a", "1", "-b", "2"])
+
     def test_format_arguments_only_kwargs(self):
         _args = format_arguments(bool_test=True, c=3, s="string", f=6.6)
         self.assertEqual(_args, ["--bool_test", "-c", "3", "-s", "string", "-f", "6.6"])
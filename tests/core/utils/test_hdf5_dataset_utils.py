@@ -225,6 +225,20 @@ class Test_Hdf5_dataset_utils(unittest.TestCase):
         _res = get_hdf5_populated_dataset_keys(self._fname(1), min_dim=1, min_size=1000)
         self.assertEqual(set(_res), set(self._fulldsets))
 
+    def test_get_hdf5_populated_dataset_keys__ignore_keys_list(self):
+        _res = get_hdf5_populated_dataset_keys(
+            self._fname(1), ignore_keys=["/test/path"]
+        )
+        self.assertEqual(set(_res), {"/test/other/path/data", "/test/other/extdata"})
+
+    def test_get_hdf5_populated_dataset_keys__ignore_keys_tuple(self):
+        _res = get_hdf5_populated_dataset_keys(
+            self._fname(1), ignore_keys=("/test/other/path",)
+        )
+        self.assertEqual(
+            set(_res), {"/test/path/data", "/test/path/to/data", "/test/other/extdata"}
+        )
+
     def test_convert_data_for_writing_to_hdf5_dataset__None(self):
         _data = convert_data_for_writing_to_hdf5_dataset(None)
         self.assertEqual(_data, "::None::")
@@ -28,7 +28,7 @@ import unittest
 
 from qtpy import QtWidgets
 
-from pydidas.core.utils import update_child_qobject
+from pydidas.core.utils import apply_qt_properties, update_child_qobject
 
 
 class Test_Qt_Utilities(unittest.TestCase):
@@ -41,6 +41,18 @@ class Test_Qt_Utilities(unittest.TestCase):
         self.assertEqual(_geo.width(), _width)
         self.assertEqual(_geo.left(), _left)
 
+    def test_apply_qt_properties(self):
+        obj = QtWidgets.QWidget()
+        apply_qt_properties(obj, fixedWidth=123, unknownProperty=12)
+        self.assertEqual(obj.width(), 123)
+        self.assertFalse(hasattr(obj, "setUnknownProperty"))
+
+    def test_apply_qt_properties__tuple_args(self):
+        obj = QtWidgets.QWidget()
+        apply_qt_properties(obj, fixedSize=(42, 17))
+        self.assertEqual(obj.width(), 42)
+        self.assertEqual(obj.height(), 17)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -119,11 +119,18 @@ class TestRoiSliceManager(unittest.TestCase):
         self.assertEqual(obj._roi_key, _list)
 
     def test_check_types_roi_key__w_str(self):
-        _str = "Test, Test2"
+        _str = "7, 12"
         obj = RoiSliceManager()
         obj._roi_key = _str
         obj._check_types_roi_key()
-        self.assertIsInstance(obj._roi_key, list)
+        self.assertEqual(obj._roi_key, [7, 12])
+
+    def test_check_types_roi_key__w_invalid_str(self):
+        _str = "Test, Test2"
+        obj = RoiSliceManager()
+        obj._roi_key = _str
+        with self.assertRaises(ValueError):
+            obj._check_types_roi_key()
 
     def test_check_types_roi_key__w_tuple(self):
         _roi = ("Test", "Test2")
@@ -140,60 +147,70 @@ class TestRoiSliceManager(unittest.TestCase):
             obj._check_types_roi_key()
 
     def test_convert_str_roi_key_to_list__simple(self):
-        _roi = "7, 1234, Test2"
-        _list = [item.strip() for item in _roi.split(",")]
         obj = RoiSliceManager()
-        obj._roi_key = _roi
+        obj._roi_key = "7, 1234, -2"
         obj._convert_str_roi_key()
-        self.assertEqual(obj._roi_key, _list)
+        self.assertEqual(obj._roi_key, [7, 1234, -2])
 
     def test_convert_str_roi_key_to_list__slices(self):
-        _roi = "slice(1, 4, 1), slice(0, 4)"
-        _list = [item.strip() for item in _roi.split(",")]
         obj = RoiSliceManager()
-        obj._roi_key = _roi
+        obj._roi_key = "slice(1, 4, 1), slice(0, 4)"
         obj._convert_str_roi_key()
-        self.assertEqual(obj._roi_key, _list)
+        self.assertEqual(obj._roi_key, [slice(1, 4, 1), slice(0, 4)])
+
+    def test_convert_str_roi_key_to_list__slices_w_None_step(self):
+        obj = RoiSliceManager()
+        obj._roi_key = "slice(1, 4, None), slice(0,4)"
+        obj._convert_str_roi_key()
+        self.assertEqual(obj._roi_key, [slice(1, 4), slice(0, 4)])
 
     def test_convert_str_roi_key_to_list__with_brackets(self):
-        _roi = "(slice(1, 4, 1), slice(0, 4))"
-        _list = [item.strip() for item in _roi[1:-1].split(",")]
         obj = RoiSliceManager()
-        obj._roi_key = _roi
+        obj._roi_key = "(slice(1, 4, 1), slice(0, 4))"
         obj._convert_str_roi_key()
-        self.assertEqual(obj._roi_key, _list)
+        self.assertEqual(obj._roi_key, [slice(1, 4, 1), slice(0, 4)])
 
     def test_convert_str_roi_key_to_list__with_straight_brackets(self):
-        _roi = "[slice(1, 4, 1), slice(0, 4)]"
-        _list = [item.strip() for item in _roi[1:-1].split(",")]
         obj = RoiSliceManager()
-        obj._roi_key = _roi
+        obj._roi_key = "[slice(1, 4, 1), slice(0, 4)]"
         obj._convert_str_roi_key()
-        self.assertEqual(obj._roi_key, _list)
+        self.assertEqual(obj._roi_key, [slice(1, 4, 1), slice(0, 4)])
 
     def test_convert_str_roi_key_to_list__only_leading_bracket(self):
-        _roi = "(slice(1, 4, 1), slice(0, 4)"
-        _list = [item.strip() for item in _roi[1:].split(",")]
         obj = RoiSliceManager()
-        obj._roi_key = _roi
+        obj._roi_key = "(slice(1, 4, 1), slice(0, 4)"
         obj._convert_str_roi_key()
-        self.assertEqual(obj._roi_key, _list)
+        self.assertEqual(obj._roi_key, [slice(1, 4, 1), slice(0, 4)])
 
     def test_convert_str_roi_key_to_list__only_leading_bracket_and_ints(self):
-        _roi = "(slice(1, 4, 1), 0, 4"
-        _list = [item.strip() for item in _roi[1:].split(",")]
         obj = RoiSliceManager()
-        obj._roi_key = _roi
+        obj._roi_key = "(slice(1, 4, 1), 0, 4"
         obj._convert_str_roi_key()
-        self.assertEqual(obj._roi_key, _list)
+        self.assertEqual(obj._roi_key, [slice(1, 4, 1), 0, 4])
 
     def test_convert_str_roi_key_to_list__only_trailing_bracket_and_ints(self):
-        _roi = "0, 4, slice(1, 4, 1))"
-        _list = [item.strip() for item in _roi[:-1].split(",")]
         obj = RoiSliceManager()
-        obj._roi_key = _roi
+        obj._roi_key = "0, 4, slice(1, 4, 1))"
         obj._convert_str_roi_key()
-        self.assertEqual(obj._roi_key, _list)
+        self.assertEqual(obj._roi_key, [0, 4, slice(1, 4, 1)])
+
+    def test_convert_str_roi_key_to_list__invalid_entry(self):
+        obj = RoiSliceManager()
+        obj._roi_key = "7, 1234, Test2"
+        with self.assertRaises(ValueError):
+            obj._convert_str_roi_key()
+
+    def test_convert_str_roi_key_to_list__float(self):
+        obj = RoiSliceManager()
+        obj._roi_key = "7, 1234, 4.0"
+        with self.assertRaises(ValueError):
+            obj._convert_str_roi_key()
+
+    def test_convert_str_roi_key_to_list__empty_entry(self):
+        obj = RoiSliceManager()
+        obj._roi_key = "7, , 4"
+        with self.assertRaises(ValueError):
+            obj._convert_str_roi_key()
 
     def test_check_types_roi_key_entries(self):
         obj = RoiSliceManager()
@@ -214,9 +231,8 @@ class TestRoiSliceManager(unittest.TestCase):
         self.assertEqual(obj._roi_key, _roi)
 
     def test_convert_str_roi_key_entries__float(self):
-        _roi = [1, 2, 3, 4.0]
-        _strroi = ", ".join(str(item) for item in _roi)
-        obj = self.create_RoiSliceManager(_strroi)
+        _roi = ["1", "2", "3", "4.0"]
+        obj = self.create_RoiSliceManager(_roi)
         with self.assertRaises(ValueError):
             obj._convert_str_roi_key_entries()
 
@@ -253,6 +269,11 @@ class TestRoiSliceManager(unittest.TestCase):
         obj._convert_str_roi_key_entries()
         self.assertEqual(obj._roi_key, [slice(1, 5, 2), slice(0, 2, 1)])
 
+    def test_convert_str_roi_key_entries__incomplete_slice(self):
+        obj = self.create_RoiSliceManager(["1", "2", "slice(0"])
+        with self.assertRaises(ValueError):
+            obj._convert_str_roi_key_entries()
+
     def test_check_length_of_roi_key_entries(self):
         _roi = [1, 2, slice(0, 2)]
         obj = self.create_RoiSliceManager(_roi)
@@ -324,6 +345,39 @@ class TestRoiSliceManager(unittest.TestCase):
         obj.create_roi_slices()
         self.assertEqual(obj._roi, (_roi[0], slice(_roi[1], _roi[2])))
 
+    def test_create_roi_slices__cached(self):
+        _roi = "slice(1, 5), 2, 7"
+        obj = RoiSliceManager()
+        obj.roi = _roi
+        obj2 = RoiSliceManager()
+        obj2.roi = _roi
+        self.assertEqual(obj2._roi, (slice(1, 5), slice(2, 7)))
+        self.assertEqual(obj2._roi_key, obj._roi_key)
+        self.assertIsNot(obj2._roi_key, obj._roi_key)
+
+    def test_create_roi_slices__unchanged_roi_reuses_object(self):
+        obj = RoiSliceManager(input_shape=(10, 10))
+        obj.roi = [0, -2, 1, -1]
+        _roi = obj.roi
+        RoiSliceManager._roi_cache.clear()
+        obj.roi = "0, 8, 1, 9"
+        self.assertIs(obj.roi, _roi)
+
+    def test_create_roi_slices__cached_w_different_shape(self):
+        _roi = [0, -2, 1, -1]
+        obj = RoiSliceManager(input_shape=(10, 10))
+        obj.roi = _roi
+        obj2 = RoiSliceManager(input_shape=(20, 20))
+        obj2.roi = _roi
+        self.assertEqual(obj._roi, (slice(0, 8), slice(1, 9)))
+        self.assertEqual(obj2._roi, (slice(0, 18), slice(1, 19)))
+
+    def test_create_roi_slices__cached_w_invalid_type(self):
+        obj = RoiSliceManager()
+        obj.roi = [0, 5, 0, 5]
+        with self.assertRaises(ValueError):
+            obj.roi = [0, 5.0, 0, 5]
+
     def test_roi_getter(self):
         _roi = [slice(0, 5), 1, 5]
         obj = RoiSliceManager(roi=_roi)
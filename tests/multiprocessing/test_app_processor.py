@@ -98,7 +98,7 @@ class Test_app_processor(unittest.TestCase):
 
     def put_ints_in_queue(self, finalize=True):
         for i in range(self.n_test):
-            self.input_queue.put(i)
+            self.input_queue.put([i])
         if finalize:
             self.input_queue.put(None)
 
@@ -97,7 +97,7 @@ class Test_processor(unittest.TestCase):
 
     def put_ints_in_queue(self):
         for i in range(self.n_test):
-            self.input_queue.put(i)
+            self.input_queue.put([i])
         self.input_queue.put(None)
 
     def get_results(self):
@@ -118,6 +118,22 @@ class Test_processor(unittest.TestCase):
         _input, _output = self.get_results()
         self.assertTrue((_input == _output).all())
 
+    def test_run__batched_tasks(self):
+        for i in range(0, self.n_test, 3):
+            self.input_queue.put(list(range(i, min(i + 3, self.n_test))))
+        self.input_queue.put(None)
+        processor(
+            self.input_queue,
+            self.output_queue,
+            self.stop_queue,
+            self.aborted_queue,
+            lambda x: x,
+        )
+        _input, _output = self.get_results()
+        self.assertTrue((_input == np.arange(self.n_test)).all())
+        self.assertTrue((_input == _output).all())
+        self.assertEqual(self.output_queue.get(timeout=1), [None, None])
+
     def test_run__with_empty_queue(self):
         _thread = _ProcThread(
             self.input_queue,
@@ -25,7 +25,9 @@ __status__ = "Production"
 
 
 import multiprocessing as mp
+import os
 import sys
+import threading
 import time
 import unittest
 
@@ -109,6 +111,22 @@ class TestWorkerController(unittest.TestCase):
         with self.assertRaises(ValueError):
             wc.n_workers = num_workers
 
+    def test_batch_size__get(self):
+        wc = WorkerController(batch_size=4)
+        self.assertEqual(wc.batch_size, 4)
+
+    def test_batch_size__set(self):
+        wc = WorkerController()
+        wc.batch_size = 3
+        self.assertEqual(wc.batch_size, 3)
+
+    def test_batch_size__set_wrong(self):
+        wc = WorkerController()
+        for _size in [0, 2.5]:
+            with self.subTest(size=_size):
+                with self.assertRaises(ValueError):
+                    wc.batch_size = _size
+
     def test_progress__no_target(self):
         wc = WorkerController()
         self.assertEqual(wc.progress, -1)
@@ -202,11 +220,23 @@ class TestWorkerController(unittest.TestCase):
             self.assertIsInstance(worker, mp.Process)
         wc.cycle_post_run()
 
+    @unittest.skipUnless(hasattr(os, "sched_setaffinity"), "No CPU affinity support")
+    def test_create_and_start_workers__pinned(self):
+        wc = WorkerController(n_workers=2, pin_workers=True)
+        wc._create_and_start_workers()
+        _cpus = os.sched_getaffinity(0)
+        for worker in wc._workers:
+            _affinity = os.sched_getaffinity(worker.pid)
+            self.assertEqual(len(_affinity), 1)
+            self.assertTrue(_affinity.issubset(_cpus))
+        wc.cycle_post_run()
+
     def test_add_task(self):
         wc = WorkerController()
         wc.suspend()
         wc.add_task(1)
-        self.assertEqual(wc._to_process, [1])
+        self.assertEqual(list(wc._to_process), [1])
+        self.assertEqual(wc._progress_target, 1)
 
     def test_wait_for_processes_to_finish(self):
         _timeout = 0.2
@@ -216,12 +246,23 @@ class TestWorkerController(unittest.TestCase):
         wc._wait_for_processes_to_finish(timeout=_timeout)
         self.assertTrue(time.time() - t0 >= _timeout)
 
+    def test_wait_for_processes_to_finish__woken_by_join(self):
+        wc = WorkerController()
+        wc.flags["active"] = True
+        _timer = threading.Timer(0.05, wc.join_workers)
+        _timer.start()
+        t0 = time.time()
+        wc._wait_for_processes_to_finish(timeout=2)
+        _timer.join()
+        self.assertFalse(wc.flags["active"])
+        self.assertTrue(time.time() - t0 < 1)
+
     def test_add_tasks(self):
         _tasks = [1, 2, 3]
         wc = WorkerController()
         wc.suspend()
         wc.add_tasks(_tasks)
-        self.assertEqual(wc._to_process, _tasks)
+        self.assertEqual(list(wc._to_process), _tasks)
 
     def test_add_tasks__previous_tasks(self):
         _tasks = [1, 2, 3]
@@ -229,14 +270,47 @@ class TestWorkerController(unittest.TestCase):
         wc.suspend()
         wc.add_task(0)
         wc.add_tasks(_tasks)
-        self.assertEqual(wc._to_process, [0] + _tasks)
+        self.assertEqual(list(wc._to_process), [0] + _tasks)
 
     def test_put_next_task_in_queue(self):
         wc = WorkerController()
-        wc._to_process = [1, 2, 3]
+        wc._to_process.extend([1, 2, 3])
         wc._put_next_task_in_queue()
         self.assertEqual(wc._queues["send"].qsize(), 1)
 
+    def test_put_next_task_in_queue__batch(self):
+        wc = WorkerController(batch_size=2)
+        wc._to_process.extend([1, 2, 3])
+        wc._put_next_task_in_queue()
+        self.assertEqual(wc._queues["send"].get(timeout=1), [1, 2])
+        self.assertEqual(list(wc._to_process), [3])
+
+    def test_put_next_task_in_queue__batch_w_stop_tasks(self):
+        wc = WorkerController(batch_size=4)
+        wc._to_process.extend([1, 2, None, None])
+        for _ in range(3):
+            wc._put_next_task_in_queue()
+        self.assertEqual(wc._queues["send"].get(timeout=1), [1, 2])
+        self.assertIsNone(wc._queues["send"].get(timeout=1))
+        self.assertIsNone(wc._queues["send"].get(timeout=1))
+        self.assertEqual(len(wc._to_process), 0)
+
+    def test_run__batched(self):
+        _tasks = [1, 2, 3, 4, 5]
+        wc = WorkerController(n_workers=2, batch_size=2)
+        wc.change_function(local_test_func, *(0, 0))
+        _spy = QtTest.QSignalSpy(wc.sig_results)
+        wc.add_tasks(_tasks)
+        wc.finalize_tasks()
+        wc.start()
+        if IS_QT6:
+            self.wait_for_finish_signal_qt6(wc)
+            _results = [_spy.at(_index)[0] for _index in range(_spy.count())]
+        else:
+            self.wait_for_finish_signal(wc)
+            _results = get_spy_values(_spy)
+        self.assertEqual(sorted(_results), _tasks)
+
     def test_get_and_emit_all_queue_items(self):
         _res1 = 3
         _res2 = [1, 1]
@@ -256,6 +330,21 @@ class TestWorkerController(unittest.TestCase):
             self.assertEqual(_spy[0][1], _res1)
             self.assertEqual(_spy[1][1], _res2)
 
+    def test_get_and_emit_all_queue_items__throttled_progress(self):
+        wc = WorkerController()
+        for _index in range(3):
+            wc._queues["recv"].put([_index, _index])
+        wc._progress_target = 3
+        _spy = QtTest.QSignalSpy(wc.sig_progress)
+        time.sleep(0.005)
+        wc._get_and_emit_all_queue_items()
+        if IS_QT6:
+            self.assertEqual(_spy.count(), 2)
+            self.assertEqual(_spy.at(1)[0], 1)
+        else:
+            self.assertEqual(len(_spy), 2)
+            self.assertEqual(_spy[1][0], 1)
+
     def test_check_if_workers_done__no_signal(self):
         wc = WorkerController(n_workers=2)
         wc.flags["running"] = True
@@ -40,6 +40,7 @@ from pydidas.core import Dataset, Parameter, get_generic_parameter
 from pydidas.core.constants import INPUT_PLUGIN
 from pydidas.core.utils import get_random_string
 from pydidas.data_io import import_data
+from pydidas.managers import ImageMetadataManager
 from pydidas.plugins import InputPlugin
 from pydidas.unittest_objects import create_plugin_class
 
@@ -162,6 +163,14 @@ class TestBaseInputPlugin(unittest.TestCase):
         plugin.prepare_carryon_check()
         self.assertEqual(plugin._config["file_size"], os.stat(self._fname).st_size)
 
+    def test_image_metadata__created_on_first_access(self):
+        _class = create_plugin_class(INPUT_PLUGIN)
+        plugin = _class()
+        self.assertIsNone(plugin._InputPlugin__image_metadata)
+        _metadata = plugin._image_metadata
+        self.assertIsInstance(_metadata, ImageMetadataManager)
+        self.assertIs(plugin._image_metadata, _metadata)
+
     def test_setup_image_metadata_manager__with_different_hdf5_key(self):
         _class = create_plugin_class(INPUT_PLUGIN)
         _class.default_params.add_param(get_generic_parameter("hdf5_key"))
@@ -66,11 +66,13 @@ class TestPluginRegistry(unittest.TestCase):
         cls._syspath = copy.copy(sys.path)
         cls._qsettings = PydidasQsettings()
         cls._qsettings_plugin_path = cls._qsettings.value("user/plugin_path")
+        cls._qsettings_plugin_index = cls._qsettings.value("global/plugin_index")
 
     @classmethod
     def tearDownClass(cls):
         shutil.rmtree(cls._dummy_path)
         cls._qsettings.set_value("user/plugin_path", cls._qsettings_plugin_path)
+        cls._qsettings.set_value("global/plugin_index", cls._qsettings_plugin_index)
         sys.path = cls._syspath
 
     def setUp(self):
@@ -204,7 +206,7 @@ class TestPluginRegistry(unittest.TestCase):
     def test_clear_collection__with_confirmation(self):
         PC = PluginRegistry()
         PC.clear_collection(True)
-        for _key in ["plugins", "_plugin_types", "_plugin_names"]:
+        for _key in ["plugins", "_plugin_types", "_plugin_names", "_plugins_by_type"]:
             self.assertEqual(getattr(PC, _key), {})
 
     def test_registered_paths(self):
@@ -246,6 +248,38 @@ class TestPluginRegistry(unittest.TestCase):
         _plugin = PC.get_plugin_by_name(_name)
         self.assertTrue(issubclass(_plugin, BasePlugin))
 
+    def test_get_plugin_by_name__from_index(self):
+        self.create_plugin_file_tree(depth=1, width=1)
+        PC = PluginRegistry(plugin_path=self._pluginpath, use_generic_plugins=False)
+        PC.verify_is_initialized()
+        _name = self._class_names[0]
+        PC2 = PluginRegistry(plugin_path=self._pluginpath, use_generic_plugins=False)
+        _plugin = PC2.get_plugin_by_name(_name)
+        self.assertEqual(_plugin.__name__, _name)
+        self.assertFalse(PC2._config["initialized"])
+        self.assertIs(PC2.get_plugin_by_name(_name), _plugin)
+
+    def test_get_plugin_by_name__from_outdated_index(self):
+        _dirs, _ = self.create_plugin_file_tree(depth=1, width=1)
+        PC = PluginRegistry(plugin_path=self._pluginpath, use_generic_plugins=False)
+        PC.verify_is_initialized()
+        with open(_dirs[0].joinpath(self._good_filenames[0]), "a") as f:
+            f.write("\n# modified file\n")
+        PC2 = PluginRegistry(plugin_path=self._pluginpath, use_generic_plugins=False)
+        _plugin = PC2.get_plugin_by_name(self._class_names[0])
+        self.assertEqual(_plugin.__name__, self._class_names[0])
+        self.assertTrue(PC2._config["initialized"])
+
+    def test_get_plugin_by_plugin_name__from_index(self):
+        self.create_plugin_file_tree(depth=1, width=1)
+        PC = PluginRegistry(plugin_path=self._pluginpath, use_generic_plugins=False)
+        PC.verify_is_initialized()
+        _plugin_name = PC.plugins[self._class_names[0]].plugin_name
+        PC2 = PluginRegistry(plugin_path=self._pluginpath, use_generic_plugins=False)
+        _plugin = PC2.get_plugin_by_plugin_name(_plugin_name)
+        self.assertEqual(_plugin.__name__, self._class_names[0])
+        self.assertFalse(PC2._config["initialized"])
+
     def test_get_plugin_by_name__base_plugin(self):
         PC = self.get_registry_with_random_plugins()
         _plugin = PC.get_plugin_by_name("BasePlugin")
@@ -278,8 +312,11 @@ class TestPluginRegistry(unittest.TestCase):
     def test_remove_plugin_from_collection__existing_item(self):
         PC = self.get_registry_with_random_plugins()
         _name = PC.get_all_plugin_names()[0]
-        PC.remove_plugin_from_collection(PC.plugins[_name])
+        _cls = PC.plugins[_name]
+        PC.remove_plugin_from_collection(_cls)
         self.assertNotIn(_name, PC.plugins)
+        for _type in ["input", "proc", "output"]:
+            self.assertNotIn(_cls, PC.get_all_plugins_of_type(_type))
 
     def test_add_new_class(self):
         PC = self.get_registry_with_random_plugins()
@@ -310,6 +347,15 @@ class TestPluginRegistry(unittest.TestCase):
         PC.check_and_register_class(float)
         self.assertEqual(len(PC.get_all_plugins()), self.n_plugin)
 
+    def test_check_and_register_class__same_class_reload(self):
+        self.n_plugin = 2
+        PC = self.get_registry_with_random_plugins()
+        _new_cls = create_plugin_class(0, number=self.n_plugin + 1)
+        PC.check_and_register_class(_new_cls)
+        PC.remove_plugin_from_collection = lambda cls: self.fail("class removed")
+        PC.check_and_register_class(_new_cls, reload=True)
+        self.assertIs(PC.plugins[_new_cls.__name__], _new_cls)
+
     def test_check_and_register_class__new_class_with_same_name(self):
         self.n_plugin = 2
         _new_cls = create_plugin_class(0, number=self.n_plugin + 1)
@@ -359,6 +405,13 @@ class TestPluginRegistry(unittest.TestCase):
         self.assertEqual(_qplugin_path, "")
         self.assertNotIn(_path, PC._plugin_paths)
 
+    def test_store_plugin_path__wo_qsettings(self):
+        self._qsettings.set_value("user/plugin_path", "")
+        PC = PluginRegistry(use_generic_plugins=False)
+        PC._store_plugin_path(self._pluginpath, store_in_qsettings=False)
+        self.assertIn(self._pluginpath, PC._plugin_paths)
+        self.assertEqual(self._qsettings.value("user/plugin_path"), "")
+
     def test_store_plugin_path__existing_paths(self):
         PC = PluginRegistry(
             plugin_path=self._pluginpath,
@@ -414,6 +467,27 @@ class TestPluginRegistry(unittest.TestCase):
         self.assertEqual(len(_mods), len(PC.plugins))
         self.assertEqual(set(PC.plugins.keys()), set(self._class_names))
 
+    def test_find_and_register_plugins__module_reused(self):
+        self.create_plugin_file_tree(depth=1, width=1)
+        PC = PluginRegistry(use_generic_plugins=False)
+        PC.find_and_register_plugins(self._pluginpath)
+        PC2 = PluginRegistry(use_generic_plugins=False)
+        PC2.find_and_register_plugins(self._pluginpath)
+        for _name in self._class_names:
+            self.assertIs(PC.plugins[_name], PC2.plugins[_name])
+
+    def test_find_and_register_plugins__modified_module_reloaded(self):
+        _dirs, _ = self.create_plugin_file_tree(depth=1, width=1)
+        PC = PluginRegistry(use_generic_plugins=False)
+        PC.find_and_register_plugins(self._pluginpath)
+        _file = _dirs[0].joinpath(self._good_filenames[0])
+        with open(_file, "a") as f:
+            f.write("\n# modified file\n")
+        PC2 = PluginRegistry(use_generic_plugins=False)
+        PC2.find_and_register_plugins(self._pluginpath)
+        _name = self._class_names[0]
+        self.assertIsNot(PC.plugins[_name], PC2.plugins[_name])
+
     def test_find_and_register_plugins__multiple_paths(self):
         _dirs, _mods = self.create_plugin_file_tree()
         self._otherpaths.append(Path(tempfile.mkdtemp()))
@@ -424,6 +498,50 @@ class TestPluginRegistry(unittest.TestCase):
         self.assertEqual(len(_newmods), len(PC.plugins))
         self.assertEqual(set(PC.plugins.keys()), set(self._class_names))
 
+    def test_find_and_register_plugins__no_reload_unchanged_path(self):
+        self.create_plugin_file_tree(depth=1, width=1)
+        PC = PluginRegistry(use_generic_plugins=False)
+        PC.find_and_register_plugins(self._pluginpath)
+        PC._scan_path_for_plugins = lambda *args: self.fail("path searched again")
+        PC.find_and_register_plugins(self._pluginpath, reload=False)
+
+    def test_find_and_register_plugins__no_reload_changed_path(self):
+        _dirs, _ = self.create_plugin_file_tree(depth=1, width=1)
+        PC = PluginRegistry(use_generic_plugins=False)
+        PC.find_and_register_plugins(self._pluginpath)
+        with open(_dirs[0].joinpath("new_module.py"), "w") as f:
+            f.write(self.get_random_class_def(store_name=True))
+        PC.find_and_register_plugins(self._pluginpath, reload=False)
+        self.assertIn(self._class_names[-1], PC.plugins)
+
+    def test_find_and_register_plugins__declared_plugins(self):
+        _names = [get_random_string(11).upper() for _ in range(2)]
+        with open(self._pluginpath.joinpath("declared_plugins.py"), "w") as f:
+            f.write(
+                "from pydidas.plugins import ProcPlugin, register_plugin\n"
+                "\n@register_plugin"
+                f"\nclass {_names[0]}(ProcPlugin):"
+                "\n    basic_plugin = False"
+                f'\n    plugin_name = "{_names[0]}"'
+                f"\n\nclass {_names[1]}(ProcPlugin):"
+                "\n    basic_plugin = False"
+                f'\n    plugin_name = "{_names[1]}"\n'
+            )
+        PC = PluginRegistry(use_generic_plugins=False)
+        PC.find_and_register_plugins(self._pluginpath)
+        self.assertIn(_names[0], PC.plugins)
+        self.assertNotIn(_names[1], PC.plugins)
+
+    def test_find_and_register_plugins__multiple_paths_order(self):
+        self.create_plugin_file_tree(depth=1, width=1)
+        self._otherpaths.append(Path(tempfile.mkdtemp()))
+        self.create_plugin_file_tree(self._otherpaths[0], depth=1, width=1)
+        PC = PluginRegistry(use_generic_plugins=False)
+        PC.find_and_register_plugins(self._otherpaths[0], self._pluginpath)
+        self.assertEqual(PC._plugin_paths, [self._otherpaths[0], self._pluginpath])
+        self.assertIn(str(self._pluginpath), PC._plugin_index)
+        self.assertIn(str(self._otherpaths[0]), PC._plugin_index)
+
     def test_get_q_settings_plugin_paths__no_path_set(self):
         self._qsettings.set_value("user/plugin_path", None)
         PC = PluginRegistry(use_generic_plugins=False)
@@ -37,6 +37,7 @@ import pyFAI
 from pydidas.contexts import DiffractionExperimentContext
 from pydidas.core import UserConfigError, get_generic_parameter
 from pydidas.plugins import BasePlugin, pyFAIintegrationBase
+from pydidas.plugins.pyfai_integration_base import MASK_CACHE_SIZE, _MASK_CACHE
 
 
 EXP = DiffractionExperimentContext()
@@ -546,6 +547,46 @@ class TestPyFaiIntegrationBase(unittest.TestCase):
         plugin.load_and_set_mask()
         self.assertTrue((plugin._mask == _mask).all())
 
+    def test_load_and_set_mask__reused(self):
+        _maskfilename, _mask = self.create_mask()
+        EXP.set_param_value("detector_mask_file", _maskfilename)
+        plugin = pyFAIintegrationBase()
+        plugin.load_and_set_mask()
+        plugin2 = pyFAIintegrationBase()
+        plugin2.load_and_set_mask()
+        self.assertIn(_maskfilename, _MASK_CACHE)
+        self.assertTrue(np.array_equal(plugin2._mask, _mask))
+        self.assertFalse(np.shares_memory(plugin._mask, plugin2._mask))
+
+    def test_load_and_set_mask__modified_file(self):
+        _maskfilename, _mask = self.create_mask()
+        EXP.set_param_value("detector_mask_file", _maskfilename)
+        plugin = pyFAIintegrationBase()
+        plugin.load_and_set_mask()
+        _new_mask = np.ones((self._shape[0] + 3, self._shape[1]))
+        np.save(_maskfilename, _new_mask)
+        plugin.load_and_set_mask()
+        self.assertTrue(np.array_equal(plugin._mask, _new_mask))
+
+    def test_load_and_set_mask__cache_size_limited(self):
+        _filenames = []
+        for _index in range(MASK_CACHE_SIZE + 1):
+            _filenames.append(os.path.join(self._temppath, f"mask_{_index}.npy"))
+            np.save(_filenames[-1], np.full(self._shape, _index % 2))
+        plugin = pyFAIintegrationBase()
+        for _filename in _filenames:
+            EXP.set_param_value("detector_mask_file", _filename)
+            plugin.load_and_set_mask()
+        self.assertLessEqual(len(_MASK_CACHE), MASK_CACHE_SIZE)
+        self.assertNotIn(_filenames[0], _MASK_CACHE)
+        self.assertIn(_filenames[-1], _MASK_CACHE)
+
+    def test_load_and_set_mask__directory(self):
+        plugin = pyFAIintegrationBase()
+        EXP.set_param_value("detector_mask_file", self._temppath)
+        with self.assertRaises(UserConfigError):
+            plugin.load_and_set_mask()
+
     def test_load_and_set_mask__wrong_local_mask_and_q_settings(self):
         _maskfilename, _mask = self.create_mask()
         plugin = pyFAIintegrationBase()
@@ -562,6 +603,56 @@ class TestPyFaiIntegrationBase(unittest.TestCase):
         plugin.pre_execute()
         self.assertIsInstance(plugin._ai, pyFAI.azimuthalIntegrator.AzimuthalIntegrator)
 
+    def test_pre_execute__shared_integrator(self):
+        plugin = pyFAIintegrationBase()
+        plugin.pre_execute()
+        plugin2 = pyFAIintegrationBase()
+        plugin2.pre_execute()
+        self.assertIs(plugin._ai, plugin2._ai)
+
+    def test_pre_execute__different_azimuthal_range(self):
+        plugin = pyFAIintegrationBase()
+        plugin.pre_execute()
+        plugin2 = pyFAIintegrationBase(
+            azi_use_range="Specify azimuthal range",
+            azi_range_lower=-30,
+            azi_range_upper=30,
+        )
+        plugin2.pre_execute()
+        self.assertIsNot(plugin._ai, plugin2._ai)
+
+    def test_pre_execute__different_mask(self):
+        plugin = pyFAIintegrationBase()
+        plugin.pre_execute()
+        _maskfilename, _ = self.create_mask()
+        EXP.set_param_value("detector_mask_file", _maskfilename)
+        plugin2 = pyFAIintegrationBase()
+        plugin2.pre_execute()
+        self.assertIsNot(plugin._ai, plugin2._ai)
+
+    def test_pre_execute__modified_mask_file(self):
+        _maskfilename, _mask = self.create_mask()
+        EXP.set_param_value("detector_mask_file", _maskfilename)
+        plugin = pyFAIintegrationBase()
+        plugin.pre_execute()
+        _stat = os.stat(_maskfilename)
+        np.save(_maskfilename, 1 - _mask)
+        os.utime(_maskfilename, ns=(_stat.st_atime_ns, _stat.st_mtime_ns + 10**9))
+        plugin2 = pyFAIintegrationBase()
+        plugin2.pre_execute()
+        self.assertIsNot(plugin._ai, plugin2._ai)
+        self.assertTrue(np.array_equal(plugin2._mask, 1 - _mask))
+
+    def test_check_and_set_custom_mask__shared_integrator(self):
+        plugin = pyFAIintegrationBase()
+        plugin.pre_execute()
+        plugin2 = pyFAIintegrationBase()
+        plugin2.pre_execute()
+        _mask = np.zeros(plugin._ai.detector.shape, dtype=int)
+        plugin.check_and_set_custom_mask(custom_mask=_mask)
+        self.assertIsNot(plugin._ai, plugin2._ai)
+        self.assertTrue(plugin._config["custom_mask"])
+
 
 if __name__ == "__main__":
     unittest.main()
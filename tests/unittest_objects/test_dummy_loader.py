@@ -27,6 +27,8 @@ __status__ = "Production"
 import pickle
 import unittest
 
+import numpy as np
+
 from pydidas.core import Dataset
 from pydidas.core.utils import get_random_string
 from pydidas.unittest_objects import DummyLoader
@@ -77,6 +79,23 @@ class TestDummyLoader(unittest.TestCase):
         self.assertEqual(_newdata.shape, _shape)
         self.assertEqual(_kws["index"], _index)
 
+    def test_execute__after_pre_execute(self):
+        _shape = (27, 45)
+        plugin = DummyLoader(image_height=_shape[0], image_width=_shape[1])
+        plugin.pre_execute()
+        _newdata, _ = plugin.execute(0)
+        self.assertEqual(plugin._image_shape, _shape)
+        self.assertEqual(_newdata.shape, _shape)
+
+    def test_execute__new_data_each_call(self):
+        plugin = DummyLoader()
+        plugin.pre_execute()
+        _data1, _ = plugin.execute(1)
+        _data2, _ = plugin.execute(2)
+        self.assertEqual(_data1.dtype, np.float32)
+        self.assertFalse(np.shares_memory(_data1, _data2))
+        self.assertFalse(np.allclose(_data1, _data2))
+
     def test_pickle_unpickle(self):
         plugin = DummyLoader()
         new_plugin = pickle.loads(pickle.dumps(plugin))
@@ -56,10 +56,36 @@ class TestPydidasStatusWidget(unittest.TestCase):
     def test_add_status(self):
         _test = "This is the test string"
         obj = PydidasStatusWidget()
+        # The widget is not shown and messages are displayed immediately. Visible
+        # widgets collect messages and require a flush or a running event loop.
         obj.add_status(_test)
         _text = obj.toPlainText()
         self.assertTrue(_text.strip().endswith(_test))
 
+    def test_add_status__visible_widget_batched_newest_on_top(self):
+        obj = PydidasStatusWidget()
+        obj.clear()
+        obj.show()
+        obj.add_status("first message")
+        obj.add_status("second message")
+        self.assertEqual(obj.toPlainText(), "")
+        obj.flush()
+        _lines = obj.toPlainText().strip().split("\n")
+        obj.hide()
+        self.assertEqual(len(_lines), 2)
+        self.assertTrue(_lines[0].endswith("second message"))
+        self.assertTrue(_lines[1].endswith("first message"))
+
+    def test_hideEvent__pending_messages_flushed(self):
+        _test = "This is the hide test string"
+        obj = PydidasStatusWidget()
+        obj.clear()
+        obj.show()
+        obj.add_status(_test)
+        self.assertNotIn(_test, obj.toPlainText())
+        obj.hide()
+        self.assertTrue(obj.toPlainText().strip().endswith(_test))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,133 @@
+# This file is part of pydidas.
+#
+# Copyright 2024, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for pydidas modules."""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2024, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from qtpy import QtWidgets
+
+from pydidas.core import FileReadError
+from pydidas.widgets.selection import RawMetadataSelector
+from pydidas.widgets.selection.raw_metadata_selector import _RawDecodeRunnable
+from pydidas_qtcore import PydidasQApplication
+
+
+class _PlotWidget(QtWidgets.QWidget):
+    def __init__(self):
+        QtWidgets.QWidget.__init__(self)
+        self.images = []
+
+    def display_image(self, data, **kwargs):
+        self.images.append(data)
+
+
+class TestRawMetadataSelector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.q_app = QtWidgets.QApplication.instance()
+        if cls.q_app is None:
+            cls.q_app = PydidasQApplication(sys.argv)
+        cls._path = Path(tempfile.mkdtemp())
+        cls._fname = cls._path.joinpath("test.raw")
+        cls._data = np.random.random((12, 14))
+        cls._data.tofile(cls._fname)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._path)
+        cls.q_app.quit()
+
+    def create_selector(self):
+        _plot = _PlotWidget()
+        obj = RawMetadataSelector(plot_widget=_plot)
+        obj._config["filename"] = self._fname
+        obj.set_param_value("raw_datatype", "float 64 bit")
+        obj.set_param_value("raw_shape_y", 12)
+        obj.set_param_value("raw_shape_x", 14)
+        obj.set_param_value("raw_header", 0)
+        return obj, _plot
+
+    def wait_for_reads(self, obj):
+        obj._thread_pool.waitForDone()
+        QtWidgets.QApplication.processEvents()
+
+    def test_decode_file__display(self):
+        obj, _plot = self.create_selector()
+        obj._decode_file()
+        self.wait_for_reads(obj)
+        self.assertEqual(len(_plot.images), 1)
+        self.assertTrue(np.allclose(_plot.images[0], self._data))
+        self.assertTrue(obj._widgets["confirm"].isEnabled())
+
+    def test_decode_file__superseded_read(self):
+        obj, _plot = self.create_selector()
+        obj._decode_file()
+        obj.set_param_value("raw_shape_y", 11)
+        obj.set_param_value("raw_header", self._data[0].nbytes)
+        obj._decode_file()
+        self.wait_for_reads(obj)
+        self.assertEqual(len(_plot.images), 1)
+        self.assertTrue(np.allclose(_plot.images[0], self._data[1:]))
+        self.assertTrue(obj._widgets["confirm"].isEnabled())
+
+    def test_display_decoded_data__stale_read(self):
+        obj, _plot = self.create_selector()
+        obj._config["read_id"] = 2
+        obj._widgets["confirm"].setEnabled(False)
+        obj._RawMetadataSelector__display_decoded_data(1, self._data, None)
+        self.assertEqual(len(_plot.images), 0)
+        self.assertFalse(obj._widgets["confirm"].isEnabled())
+
+    def test_display_decoded_data__error_reraised(self):
+        obj, _plot = self.create_selector()
+        obj._config["read_id"] = 1
+        obj._widgets["confirm"].setEnabled(False)
+        with self.assertRaises(FileReadError):
+            obj._RawMetadataSelector__display_decoded_data(
+                1, None, FileReadError("Cannot read file.")
+            )
+        self.assertEqual(len(_plot.images), 0)
+        self.assertTrue(obj._widgets["confirm"].isEnabled())
+
+    def test_raw_decode_runnable__error(self):
+        _results = []
+        _runnable = _RawDecodeRunnable(
+            3, self._path.joinpath("missing.raw"), datatype=np.float64, shape=(12, 14)
+        )
+        _runnable.signals.sig_finished.connect(lambda *_args: _results.append(_args))
+        _runnable.run()
+        self.assertEqual(len(_results), 1)
+        self.assertEqual(_results[0][0], 3)
+        self.assertIsNone(_results[0][1])
+        self.assertIsInstance(_results[0][2], Exception)
+
+
+if __name__ == "__main__":
+    unittest.main()